@@ -8,6 +8,12 @@ from typing import TypeVar, Generic, Optional
 from .runtime.bitrpc.client import BaseClient, RpcClientFactory, IRpcClient
 from ..data.models import LoginRequest, GetUserRequest, EchoRequest, LoginResponse, GetUserResponse, EchoResponse, UserInfo
 
+# Method names pre-encoded once; call_async sends them without re-encoding
+_METHOD_LOGIN = b"TestService.Login"
+_METHOD_GETUSER = b"TestService.GetUser"
+_METHOD_ECHO = b"TestService.Echo"
+_METHOD_STREAMUSERS = b"TestService.StreamUsers"
+
 class TestServiceClient(BaseClient):
     """Client for TestService service"""
 
@@ -16,23 +22,23 @@ class TestServiceClient(BaseClient):
 
     @classmethod
     def create_tcp_client(cls, host: str, port: int) -> 'TestServiceClient':
-        """Create a TCP client for the service"
+        """Create a TCP client for the service"""
         tcp_client = RpcClientFactory.create_tcp_client(host, port)
         return cls(tcp_client)
 
     async def Login_async(self, request: LoginRequest) -> LoginResponse:
         """Call Login method"""
-        return await self.call_async("TestService.Login", request)
+        return await self.call_async(_METHOD_LOGIN, request)
 
     async def GetUser_async(self, request: GetUserRequest) -> GetUserResponse:
         """Call GetUser method"""
-        return await self.call_async("TestService.GetUser", request)
+        return await self.call_async(_METHOD_GETUSER, request)
 
     async def Echo_async(self, request: EchoRequest) -> EchoResponse:
         """Call Echo method"""
-        return await self.call_async("TestService.Echo", request)
+        return await self.call_async(_METHOD_ECHO, request)
 
     async def StreamUsers_async(self, request: GetUserRequest) -> UserInfo:
         """Call StreamUsers method"""
-        return await self.call_async("TestService.StreamUsers", request)
+        return await self.call_async(_METHOD_STREAMUSERS, request)
 
@@ -9,7 +9,7 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class UserInfo:
     """
     user_id: int
@@ -27,7 +27,7 @@ class UserInfo:
     is_active: bool = False
     created_at: datetime = None
 
-@dataclass
+@dataclass(slots=True)
 class LoginRequest:
     """
     username: str
@@ -37,7 +37,7 @@ class LoginRequest:
     username: str = ""
     password: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class LoginResponse:
     """
     success: bool
@@ -51,7 +51,7 @@ class LoginResponse:
     token: str = ""
     error_message: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class GetUserRequest:
     """
     user_id: int
@@ -59,7 +59,7 @@ class GetUserRequest:
 
     user_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class GetUserResponse:
     """
     user: UserInfo
@@ -69,7 +69,7 @@ class GetUserResponse:
     user: UserInfo = None
     found: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class EchoRequest:
     """
     message: str
@@ -79,7 +79,7 @@ class EchoRequest:
     message: str = ""
     timestamp: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class EchoResponse:
     """
     message: str
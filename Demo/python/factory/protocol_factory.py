@@ -10,8 +10,16 @@ from .serialization.registry import register_serializers
 class ProtocolFactory:
     """Factory for initializing protocol components"""
 
-    @staticmethod
-    def initialize() -> None:
-        """Initialize protocol serializers and components"""
+    _initialized = False
+
+    @classmethod
+    def initialize(cls) -> None:
+        """Initialize protocol serializers and components.
+
+        Idempotent: callers may invoke this freely (e.g. once per client
+        and per server); registration runs only on the first call."""
+        if cls._initialized:
+            return
         serializer = BufferSerializer.instance()
         register_serializers(serializer)
+        cls._initialized = True
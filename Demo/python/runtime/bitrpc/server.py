@@ -1,22 +1,34 @@
 import asyncio
+import logging
+import socket
 import struct
 import json
-from typing import Any, Dict, Callable, Optional, List, TypeVar, Generic
+from typing import Any, Dict, Callable, Optional, List, Tuple, TypeVar, Generic
 from abc import ABC, abstractmethod
-from .serialization import BufferSerializer, StreamWriter, StreamReader
+from .serialization import BufferSerializer, StreamWriter, StreamReader, writer_pool
 from .client import IRpcClient
 
 T = TypeVar('T')
 R = TypeVar('R')
 
+logger = logging.getLogger(__name__)
+
+# Pre-compiled frame header format (little-endian uint32)
+_U32 = struct.Struct('<I')
+
 class RpcServer:
     """TCP-based RPC server implementation"""
 
     def __init__(self, host: str, port: int, serializer: Optional[BufferSerializer] = None):
         self.host = host
         self.port = port
-        self._serializer = serializer or BufferSerializer()
+        # Default to the shared serializer so handler registrations (and
+        # cache warmth) are common to every server in the process
+        self._serializer = serializer or BufferSerializer.instance()
         self._services: Dict[str, 'BaseService'] = {}
+        # Flat dispatch table: "Service.Method" -> (service, is_coro, func),
+        # so the per-request path is one dict lookup with no name split
+        self._dispatch: Dict[str, Tuple['BaseService', bool, Callable]] = {}
         self._server: Optional[asyncio.Server] = None
         self._running = False
 
@@ -29,7 +41,7 @@ class RpcServer:
             self.handle_client, self.host, self.port
         )
         self._running = True
-        print(f"RPC server started on {self.host}:{self.port}")
+        logger.info("RPC server started on %s:%s", self.host, self.port)
 
     async def stop_async(self):
         """Stop the RPC server"""
@@ -37,7 +49,7 @@ class RpcServer:
             self._server.close()
             await self._server.wait_closed()
         self._running = False
-        print("RPC server stopped")
+        logger.info("RPC server stopped")
 
     async def wait_async(self):
         """Wait for server to complete"""
@@ -52,48 +64,58 @@ class RpcServer:
             raise ValueError("Service must have a service_name")
 
         self._services[service_name] = service
-        print(f"Registered service: {service_name}")
+        for method_name, (is_coro, func) in service._methods.items():
+            self._dispatch[f"{service_name}.{method_name}"] = (service, is_coro, func)
+        logger.info("Registered service: %s", service_name)
 
     async def handle_client(self, reader, writer):
         """Handle incoming client connections"""
+        # Disable Nagle so small response frames go out immediately
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        # Per-connection locals for everything touched on every request:
+        # bound methods and attribute loads hoisted out of the loop
+        read_exactly = reader.readexactly
+        unpack_u32 = _U32.unpack
+        unpack_u32_from = _U32.unpack_from
+        get_entry = self._dispatch.get
+        deserialize = self._serializer.deserialize
+
         try:
             while True:
-                # Read message length
-                length_data = await reader.read(4)
-                if not length_data:
-                    break
-
-                message_length = struct.unpack('I', length_data)[0]
-
-                # Read message content
-                message_data = await reader.read(message_length)
-                if not message_data:
+                # Read the full frame; readexactly handles short reads that
+                # reader.read(n) would silently truncate on
+                try:
+                    length_data = await read_exactly(4)
+                except asyncio.IncompleteReadError:
                     break
 
-                # Parse method name and request data
-                method_length = struct.unpack('I', message_data[:4])[0]
-                method_data = message_data[4:4+method_length]
-                request_length = struct.unpack('I', message_data[4+method_length:8+method_length])[0]
-                request_data = message_data[8+method_length:8+method_length+request_length]
-
-                # Extract service and method names
-                method_name = method_data.decode('utf-8')
-                if '.' not in method_name:
-                    raise ValueError(f"Invalid method format: {method_name}")
-
-                service_name, method_key = method_name.split('.', 1)
-
-                # Find the service
-                service = self._services.get(service_name)
-                if not service:
-                    error_response = {"error": f"Service '{service_name}' not found"}
+                message_length = unpack_u32(length_data)[0]
+                message_data = await read_exactly(message_length)
+
+                # Parse method name and request data from one view of the frame
+                # instead of repeated copying slices
+                view = memoryview(message_data)
+                method_length = unpack_u32_from(view, 0)[0]
+                request_length = unpack_u32_from(view, 4 + method_length)[0]
+                # StreamReader accepts the view directly; no copy of the payload
+                request_data = view[8 + method_length:8 + method_length + request_length]
+
+                # Look up the handler in the flat table: no name split, no
+                # intermediate service lookup
+                method_name = bytes(view[4:4 + method_length]).decode('utf-8')
+                entry = get_entry(method_name)
+                if entry is None:
+                    error_response = {"error": f"Method '{method_name}' not found"}
                     await self.send_response(writer, error_response)
                     continue
 
                 # Deserialize request
                 try:
                     request_reader = StreamReader(request_data)
-                    request = self._serializer.deserialize(request_reader)
+                    request = deserialize(request_reader)
                 except Exception as e:
                     error_response = {"error": f"Request deserialization failed: {str(e)}"}
                     await self.send_response(writer, error_response)
@@ -101,32 +123,34 @@ class RpcServer:
 
                 # Handle the request
                 try:
-                    response = await service.handle_request_async(method_key, request)
+                    _, is_coro, func = entry
+                    response = await func(request) if is_coro else func(request)
                     await self.send_response(writer, response)
                 except Exception as e:
                     error_response = {"error": f"Method execution failed: {str(e)}"}
                     await self.send_response(writer, error_response)
 
         except Exception as e:
-            print(f"Error handling client: {e}")
+            logger.error("Error handling client: %s", e)
         finally:
             writer.close()
             await writer.wait_closed()
 
     async def send_response(self, writer, response: Any):
-        """Send response to client"""
+        """Send response to client.
+
+        Errors propagate to handle_client's per-connection handler; wrapping
+        them here only cost happy-path bytecode and hid the traceback."""
+        # Serialize into a pooled writer and hand the transport views of
+        # its buffer: length prefix plus body chunks, no concatenation
+        response_writer = writer_pool.acquire()
         try:
-            # Serialize response
-            response_writer = StreamWriter()
             self._serializer.serialize(response, response_writer)
-            response_data = response_writer.to_bytes()
-
-            # Send response length and data
-            writer.write(struct.pack('I', len(response_data)))
-            writer.write(response_data)
+            body = response_writer.to_iovecs()
+            writer.writelines([_U32.pack(sum(len(chunk) for chunk in body)), *body])
             await writer.drain()
-        except Exception as e:
-            print(f"Error sending response: {e}")
+        finally:
+            writer_pool.release(response_writer)
 
     @property
     def is_running(self) -> bool:
@@ -137,7 +161,9 @@ class BaseService(ABC):
     """Base class for RPC services"""
 
     def __init__(self):
-        self._methods: Dict[str, Callable] = {}
+        # Maps method name to (is_coroutine, callable); the coroutine check
+        # is done once at registration instead of per request.
+        self._methods: Dict[str, Tuple[bool, Callable]] = {}
         self._register_methods()
 
     @property
@@ -153,18 +179,18 @@ class BaseService(ABC):
 
     def register_method(self, method_name: str, method_func: Callable):
         """Register a service method"""
-        self._methods[method_name] = method_func
+        self._methods[method_name] = (asyncio.iscoroutinefunction(method_func), method_func)
 
     async def handle_request_async(self, method_name: str, request: Any) -> Any:
         """Handle a service request"""
-        method = self._methods.get(method_name)
-        if not method:
+        entry = self._methods.get(method_name)
+        if entry is None:
             raise ValueError(f"Method '{method_name}' not found")
 
-        if asyncio.iscoroutinefunction(method):
+        is_coro, method = entry
+        if is_coro:
             return await method(request)
-        else:
-            return method(request)
+        return method(request)
 
     def get_method_names(self) -> List[str]:
         """Get list of registered method names"""
@@ -187,13 +213,13 @@ class ServiceManager:
             raise ValueError(f"Service '{service_name}' already registered")
 
         self._services[service_name] = service
-        print(f"Service registered: {service_name}")
+        logger.info("Service registered: %s", service_name)
 
     def unregister_service(self, service_name: str):
         """Unregister a service"""
         if service_name in self._services:
             del self._services[service_name]
-            print(f"Service unregistered: {service_name}")
+            logger.info("Service unregistered: %s", service_name)
 
     def get_service(self, service_name: str) -> Optional[BaseService]:
         """Get a service by name"""
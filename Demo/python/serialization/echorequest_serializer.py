@@ -5,40 +5,41 @@
 
 
 from typing import Any
-from .runtime.bitrpc.serialization import TypeHandler, BitMask, StreamWriter, StreamReader
+from datetime import datetime
+from .runtime.bitrpc.serialization import TypeHandler, StreamWriter, StreamReader
 from ..data.models import EchoRequest
 
 class EchoRequestSerializer(TypeHandler):
 
-    @property
-    def hash_code(self) -> int:
-        return 1660195677
+    hash_code = 1660195677
 
     def write(self, obj: EchoRequest, writer: StreamWriter) -> None:
         message: EchoRequest = obj
-        mask = BitMask()
-
-        # Bit mask group 0
-        mask.set_bit(0, not self._is_default_string(message.message))
-        mask.set_bit(1, not self._is_default_int64(message.timestamp))
-        mask.write(writer)
+        # Single bit-mask group inlined as a plain int
+        mask = 0
+        if not self._is_default_string(message.message):
+            mask |= 0x1
+        if not self._is_default_int64(message.timestamp):
+            mask |= 0x2
+        writer.write_int32(1)
+        writer.write_uint32(mask)
 
         # Write field values
-        if mask.get_bit(0):
+        if mask & 0x1:
             writer.write_string(message.message)
-        if mask.get_bit(1):
+        if mask & 0x2:
             writer.write_int64(message.timestamp)
 
     def read(self, reader: StreamReader) -> EchoRequest:
         message = EchoRequest()
 
-        # Read bit mask group 0
-        mask0 = BitMask()
-        mask0.read(reader)
+        # Read bit mask group 0 (single group, plain int)
+        reader.read_int32()  # word count, always 1 for <=32 fields
+        mask0 = reader.read_uint32()
 
-        if mask0.get_bit(0):
+        if mask0 & 0x1:
             message.message = reader.read_string()
-        if mask0.get_bit(1):
+        if mask0 & 0x2:
             message.timestamp = reader.read_int64()
 
         return message
@@ -5,50 +5,53 @@
 
 
 from typing import Any
-from .runtime.bitrpc.serialization import TypeHandler, BitMask, StreamWriter, StreamReader
+from datetime import datetime
+from .runtime.bitrpc.serialization import TypeHandler, StreamWriter, StreamReader
 from ..data.models import EchoResponse
 
 class EchoResponseSerializer(TypeHandler):
 
-    @property
-    def hash_code(self) -> int:
-        return 361075971
+    hash_code = 361075971
 
     def write(self, obj: EchoResponse, writer: StreamWriter) -> None:
         message: EchoResponse = obj
-        mask = BitMask()
-
-        # Bit mask group 0
-        mask.set_bit(0, not self._is_default_string(message.message))
-        mask.set_bit(1, not self._is_default_int64(message.timestamp))
-        mask.set_bit(2, not self._is_default_struct(message.users))
-        mask.set_bit(3, not self._is_default_string(message.server_time))
-        mask.write(writer)
+        # Single bit-mask group inlined as a plain int
+        mask = 0
+        if not self._is_default_string(message.message):
+            mask |= 0x1
+        if not self._is_default_int64(message.timestamp):
+            mask |= 0x2
+        if not self._is_default_struct(message.users):
+            mask |= 0x4
+        if not self._is_default_string(message.server_time):
+            mask |= 0x8
+        writer.write_int32(1)
+        writer.write_uint32(mask)
 
         # Write field values
-        if mask.get_bit(0):
+        if mask & 0x1:
             writer.write_string(message.message)
-        if mask.get_bit(1):
+        if mask & 0x2:
             writer.write_int64(message.timestamp)
-        if mask.get_bit(2):
+        if mask & 0x4:
             writer.write_list(message.users, lambda x: writer.write_object(x))
-        if mask.get_bit(3):
+        if mask & 0x8:
             writer.write_string(message.server_time)
 
     def read(self, reader: StreamReader) -> EchoResponse:
         message = EchoResponse()
 
-        # Read bit mask group 0
-        mask0 = BitMask()
-        mask0.read(reader)
+        # Read bit mask group 0 (single group, plain int)
+        reader.read_int32()  # word count, always 1 for <=32 fields
+        mask0 = reader.read_uint32()
 
-        if mask0.get_bit(0):
+        if mask0 & 0x1:
             message.message = reader.read_string()
-        if mask0.get_bit(1):
+        if mask0 & 0x2:
             message.timestamp = reader.read_int64()
-        if mask0.get_bit(2):
+        if mask0 & 0x4:
             message.users = reader.read_list(lambda: reader.read_object())
-        if mask0.get_bit(3):
+        if mask0 & 0x8:
             message.server_time = reader.read_string()
 
         return message
@@ -5,35 +5,35 @@
 
 
 from typing import Any
-from .runtime.bitrpc.serialization import TypeHandler, BitMask, StreamWriter, StreamReader
+from datetime import datetime
+from .runtime.bitrpc.serialization import TypeHandler, StreamWriter, StreamReader
 from ..data.models import GetUserRequest
 
 class GetUserRequestSerializer(TypeHandler):
 
-    @property
-    def hash_code(self) -> int:
-        return 727038621
+    hash_code = 727038621
 
     def write(self, obj: GetUserRequest, writer: StreamWriter) -> None:
         message: GetUserRequest = obj
-        mask = BitMask()
-
-        # Bit mask group 0
-        mask.set_bit(0, not self._is_default_int64(message.user_id))
-        mask.write(writer)
+        # Single bit-mask group inlined as a plain int
+        mask = 0
+        if not self._is_default_int64(message.user_id):
+            mask |= 0x1
+        writer.write_int32(1)
+        writer.write_uint32(mask)
 
         # Write field values
-        if mask.get_bit(0):
+        if mask & 0x1:
             writer.write_int64(message.user_id)
 
     def read(self, reader: StreamReader) -> GetUserRequest:
         message = GetUserRequest()
 
-        # Read bit mask group 0
-        mask0 = BitMask()
-        mask0.read(reader)
+        # Read bit mask group 0 (single group, plain int)
+        reader.read_int32()  # word count, always 1 for <=32 fields
+        mask0 = reader.read_uint32()
 
-        if mask0.get_bit(0):
+        if mask0 & 0x1:
             message.user_id = reader.read_int64()
 
         return message
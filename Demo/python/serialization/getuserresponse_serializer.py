@@ -5,40 +5,41 @@
 
 
 from typing import Any
-from .runtime.bitrpc.serialization import TypeHandler, BitMask, StreamWriter, StreamReader
+from datetime import datetime
+from .runtime.bitrpc.serialization import TypeHandler, StreamWriter, StreamReader
 from ..data.models import GetUserResponse
 
 class GetUserResponseSerializer(TypeHandler):
 
-    @property
-    def hash_code(self) -> int:
-        return 523096643
+    hash_code = 523096643
 
     def write(self, obj: GetUserResponse, writer: StreamWriter) -> None:
         message: GetUserResponse = obj
-        mask = BitMask()
-
-        # Bit mask group 0
-        mask.set_bit(0, not self._is_default_struct(message.user))
-        mask.set_bit(1, not self._is_default_bool(message.found))
-        mask.write(writer)
+        # Single bit-mask group inlined as a plain int
+        mask = 0
+        if not self._is_default_struct(message.user):
+            mask |= 0x1
+        if not self._is_default_bool(message.found):
+            mask |= 0x2
+        writer.write_int32(1)
+        writer.write_uint32(mask)
 
         # Write field values
-        if mask.get_bit(0):
+        if mask & 0x1:
             writer.write_object(message.user)
-        if mask.get_bit(1):
+        if mask & 0x2:
             writer.write_bool(message.found)
 
     def read(self, reader: StreamReader) -> GetUserResponse:
         message = GetUserResponse()
 
-        # Read bit mask group 0
-        mask0 = BitMask()
-        mask0.read(reader)
+        # Read bit mask group 0 (single group, plain int)
+        reader.read_int32()  # word count, always 1 for <=32 fields
+        mask0 = reader.read_uint32()
 
-        if mask0.get_bit(0):
+        if mask0 & 0x1:
             message.user = reader.read_object()
-        if mask0.get_bit(1):
+        if mask0 & 0x2:
             message.found = reader.read_bool()
 
         return message
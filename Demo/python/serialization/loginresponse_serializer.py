@@ -5,50 +5,53 @@
 
 
 from typing import Any
-from .runtime.bitrpc.serialization import TypeHandler, BitMask, StreamWriter, StreamReader
+from datetime import datetime
+from .runtime.bitrpc.serialization import TypeHandler, StreamWriter, StreamReader
 from ..data.models import LoginResponse
 
 class LoginResponseSerializer(TypeHandler):
 
-    @property
-    def hash_code(self) -> int:
-        return 100275685
+    hash_code = 100275685
 
     def write(self, obj: LoginResponse, writer: StreamWriter) -> None:
         message: LoginResponse = obj
-        mask = BitMask()
-
-        # Bit mask group 0
-        mask.set_bit(0, not self._is_default_bool(message.success))
-        mask.set_bit(1, not self._is_default_struct(message.user))
-        mask.set_bit(2, not self._is_default_string(message.token))
-        mask.set_bit(3, not self._is_default_string(message.error_message))
-        mask.write(writer)
+        # Single bit-mask group inlined as a plain int
+        mask = 0
+        if not self._is_default_bool(message.success):
+            mask |= 0x1
+        if not self._is_default_struct(message.user):
+            mask |= 0x2
+        if not self._is_default_string(message.token):
+            mask |= 0x4
+        if not self._is_default_string(message.error_message):
+            mask |= 0x8
+        writer.write_int32(1)
+        writer.write_uint32(mask)
 
         # Write field values
-        if mask.get_bit(0):
+        if mask & 0x1:
             writer.write_bool(message.success)
-        if mask.get_bit(1):
+        if mask & 0x2:
             writer.write_object(message.user)
-        if mask.get_bit(2):
+        if mask & 0x4:
             writer.write_string(message.token)
-        if mask.get_bit(3):
+        if mask & 0x8:
             writer.write_string(message.error_message)
 
     def read(self, reader: StreamReader) -> LoginResponse:
         message = LoginResponse()
 
-        # Read bit mask group 0
-        mask0 = BitMask()
-        mask0.read(reader)
+        # Read bit mask group 0 (single group, plain int)
+        reader.read_int32()  # word count, always 1 for <=32 fields
+        mask0 = reader.read_uint32()
 
-        if mask0.get_bit(0):
+        if mask0 & 0x1:
             message.success = reader.read_bool()
-        if mask0.get_bit(1):
+        if mask0 & 0x2:
             message.user = reader.read_object()
-        if mask0.get_bit(2):
+        if mask0 & 0x4:
             message.token = reader.read_string()
-        if mask0.get_bit(3):
+        if mask0 & 0x8:
             message.error_message = reader.read_string()
 
         return message
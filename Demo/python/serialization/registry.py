@@ -5,6 +5,7 @@
 
 
 from .runtime.bitrpc.serialization import BufferSerializer
+from ..data.models import UserInfo, LoginRequest, LoginResponse, GetUserRequest, GetUserResponse, EchoRequest, EchoResponse
 
 from .userinfo_serializer import UserInfoSerializer
 from .loginrequest_serializer import LoginRequestSerializer
@@ -5,60 +5,65 @@
 
 
 from typing import Any
-from .runtime.bitrpc.serialization import TypeHandler, BitMask, StreamWriter, StreamReader
+from datetime import datetime
+from .runtime.bitrpc.serialization import TypeHandler, StreamWriter, StreamReader
 from ..data.models import UserInfo
 
 class UserInfoSerializer(TypeHandler):
 
-    @property
-    def hash_code(self) -> int:
-        return 1876671786
+    hash_code = 1876671786
 
     def write(self, obj: UserInfo, writer: StreamWriter) -> None:
         message: UserInfo = obj
-        mask = BitMask()
-
-        # Bit mask group 0
-        mask.set_bit(0, not self._is_default_int64(message.user_id))
-        mask.set_bit(1, not self._is_default_string(message.username))
-        mask.set_bit(2, not self._is_default_string(message.email))
-        mask.set_bit(3, not self._is_default_string(message.roles))
-        mask.set_bit(4, not self._is_default_bool(message.is_active))
-        mask.set_bit(5, not self._is_default_datetime(message.created_at))
-        mask.write(writer)
+        # Single bit-mask group inlined as a plain int
+        mask = 0
+        if not self._is_default_int64(message.user_id):
+            mask |= 0x1
+        if not self._is_default_string(message.username):
+            mask |= 0x2
+        if not self._is_default_string(message.email):
+            mask |= 0x4
+        if not self._is_default_string(message.roles):
+            mask |= 0x8
+        if not self._is_default_bool(message.is_active):
+            mask |= 0x10
+        if not self._is_default_datetime(message.created_at):
+            mask |= 0x20
+        writer.write_int32(1)
+        writer.write_uint32(mask)
 
         # Write field values
-        if mask.get_bit(0):
+        if mask & 0x1:
             writer.write_int64(message.user_id)
-        if mask.get_bit(1):
+        if mask & 0x2:
             writer.write_string(message.username)
-        if mask.get_bit(2):
+        if mask & 0x4:
             writer.write_string(message.email)
-        if mask.get_bit(3):
-            writer.write_list(message.roles, lambda x: writer.write_string(x))
-        if mask.get_bit(4):
+        if mask & 0x8:
+            writer.write_string_list(message.roles)
+        if mask & 0x10:
             writer.write_bool(message.is_active)
-        if mask.get_bit(5):
+        if mask & 0x20:
             writer.write_object(message.created_at)
 
     def read(self, reader: StreamReader) -> UserInfo:
         message = UserInfo()
 
-        # Read bit mask group 0
-        mask0 = BitMask()
-        mask0.read(reader)
+        # Read bit mask group 0 (single group, plain int)
+        reader.read_int32()  # word count, always 1 for <=32 fields
+        mask0 = reader.read_uint32()
 
-        if mask0.get_bit(0):
+        if mask0 & 0x1:
             message.user_id = reader.read_int64()
-        if mask0.get_bit(1):
+        if mask0 & 0x2:
             message.username = reader.read_string()
-        if mask0.get_bit(2):
+        if mask0 & 0x4:
             message.email = reader.read_string()
-        if mask0.get_bit(3):
-            message.roles = reader.read_list(lambda: reader.read_string())
-        if mask0.get_bit(4):
+        if mask0 & 0x8:
+            message.roles = reader.read_string_list()
+        if mask0 & 0x10:
             message.is_active = reader.read_bool()
-        if mask0.get_bit(5):
+        if mask0 & 0x20:
             message.created_at = reader.read_object()
 
         return message
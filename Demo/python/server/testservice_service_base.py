@@ -39,6 +39,6 @@ class TestServiceServiceBase(BaseService, ITestServiceService):
 
     @classmethod
     def register_with_manager(cls, manager: ServiceManager) -> None:
-        """Register this service with a service manager"
+        """Register this service with a service manager"""
         manager.register_service(cls())
 
@@ -71,7 +71,9 @@ namespace BitRPC.Protocol.Generator
 
             foreach (var message in definition.Messages)
             {
-                sb.AppendLine($"@dataclass");
+                // slots=True keeps field writes as fixed-offset stores instead of
+                // per-instance dict inserts (requires Python 3.10+)
+                sb.AppendLine($"@dataclass(slots=True)");
                 sb.AppendLine($"class {message.Name}:");
                 sb.AppendLine("    \"\"\"");
 
@@ -113,51 +115,133 @@ namespace BitRPC.Protocol.Generator
         private string GenerateMessageSerializer(ProtocolMessage message, GenerationOptions options)
         {
             var runtimeBase = GetRuntimeImportBase(options);
+            var batchRuns = GetPrimitiveBatchRuns(message);
+            // Messages with a single bit-mask group (<=32 fields, the common
+            // case) inline the mask as a plain int: presence tests become
+            // bitwise ops instead of BitMask method dispatches. The wire
+            // format is unchanged (word count, then the mask word).
+            var inlineMask = message.Fields.Count <= 32;
             var sb = new StringBuilder();
             sb.AppendLine(GenerateFileHeader($"{message.Name}_serializer.py", options));
             sb.AppendLine("from typing import Any");
-            sb.AppendLine($"from {runtimeBase}.serialization import TypeHandler, BitMask, StreamWriter, StreamReader");
+            // The default-check helpers annotate datetime parameters, so the
+            // import is emitted unconditionally, as in the models module
+            sb.AppendLine("from datetime import datetime");
+            if (batchRuns.Any())
+            {
+                sb.AppendLine("import struct");
+            }
+            var runtimeImports = inlineMask
+                ? "TypeHandler, StreamWriter, StreamReader"
+                : "TypeHandler, BitMask, StreamWriter, StreamReader";
+            sb.AppendLine($"from {runtimeBase}.serialization import {runtimeImports}");
 
             // 根据配置决定导入方式
             var importPath = GetModelsImportPath(options);
             sb.AppendLine($"from {importPath} import {message.Name}");
             sb.AppendLine();
 
+            // Pre-compiled Struct objects for runs of consecutive fixed-size fields
+            for (int run = 0; run < batchRuns.Count; run++)
+            {
+                var fmt = string.Concat(batchRuns[run].Select(f => GetStructFormatChar(f.Type)));
+                sb.AppendLine($"_BATCH{run} = struct.Struct('<{fmt}')");
+            }
+            if (batchRuns.Any())
+            {
+                sb.AppendLine();
+            }
+
             sb.AppendLine($"class {message.Name}Serializer(TypeHandler):");
             sb.AppendLine();
-            sb.AppendLine("    @property");
-            sb.AppendLine($"    def hash_code(self) -> int:");
-            sb.AppendLine($"        return {HashCodeHelper.ComputeHashCode(message.Name)}");
+            sb.AppendLine($"    hash_code = {HashCodeHelper.ComputeHashCode(message.Name)}");
             sb.AppendLine();
             sb.AppendLine($"    def write(self, obj: {message.Name}, writer: StreamWriter) -> None:");
             sb.AppendLine($"        message: {message.Name} = obj");
-            sb.AppendLine("        mask = BitMask()");
-            sb.AppendLine();
 
             var fieldGroups = message.Fields.Select((f, i) => new { Field = f, Index = i })
                                            .GroupBy(x => x.Index / 32)
                                            .ToList();
 
-            for (int group = 0; group < fieldGroups.Count; group++)
+            if (inlineMask)
             {
-                var fields = fieldGroups[group].ToList();
-                sb.AppendLine($"        # Bit mask group {group}");
-                foreach (var fieldInfo in fields)
+                sb.AppendLine("        # Single bit-mask group inlined as a plain int");
+                sb.AppendLine("        mask = 0");
+                foreach (var fieldInfo in fieldGroups[0].ToList())
                 {
                     var field = fieldInfo.Field;
                     var bitIndex = fieldInfo.Index % 32;
-                    sb.AppendLine($"        mask.set_bit({bitIndex}, not self._is_default_{field.Type.ToString().ToLower()}(message.{field.Name}))");
+                    sb.AppendLine($"        if not self._is_default_{field.Type.ToString().ToLower()}(message.{field.Name}):");
+                    sb.AppendLine($"            mask |= 0x{1 << bitIndex:X}");
                 }
-                sb.AppendLine($"        mask.write(writer)");
+                sb.AppendLine("        writer.write_int32(1)");
+                sb.AppendLine("        writer.write_uint32(mask)");
                 sb.AppendLine();
             }
+            else
+            {
+                sb.AppendLine("        mask = BitMask()");
+                sb.AppendLine();
+                for (int group = 0; group < fieldGroups.Count; group++)
+                {
+                    var fields = fieldGroups[group].ToList();
+                    sb.AppendLine($"        # Bit mask group {group}");
+                    foreach (var fieldInfo in fields)
+                    {
+                        var field = fieldInfo.Field;
+                        var bitIndex = fieldInfo.Index % 32;
+                        sb.AppendLine($"        mask.set_bit({bitIndex}, not self._is_default_{field.Type.ToString().ToLower()}(message.{field.Name}))");
+                    }
+                    sb.AppendLine($"        mask.write(writer)");
+                    sb.AppendLine();
+                }
+            }
+
+            // Presence tests: bitwise ops on the inlined int, BitMask calls
+            // otherwise
+            string MaskBitTest(string maskVar, int bit) =>
+                inlineMask ? $"{maskVar} & 0x{1 << bit:X}" : $"{maskVar}.get_bit({bit})";
+
+            string MaskRunTest(string maskVar, int firstBit, int count)
+            {
+                if (!inlineMask)
+                {
+                    return string.Join(" and ", Enumerable.Range(0, count)
+                        .Select(j => $"{maskVar}.get_bit({(firstBit + j) % 32})"));
+                }
+                var runMask = 0;
+                for (int j = 0; j < count; j++)
+                {
+                    runMask |= 1 << ((firstBit + j) % 32);
+                }
+                return $"({maskVar} & 0x{runMask:X}) == 0x{runMask:X}";
+            }
 
             sb.AppendLine("        # Write field values");
-            foreach (var field in message.Fields)
+            for (int i = 0; i < message.Fields.Count; i++)
             {
-                var fieldIndex = message.Fields.IndexOf(field);
-                var bitIndex = fieldIndex % 32;
-                sb.AppendLine($"        if mask.get_bit({bitIndex}):");
+                var run = batchRuns.FindIndex(r => message.Fields.IndexOf(r[0]) == i);
+                if (run >= 0)
+                {
+                    // All fields present: one batched pack instead of N calls
+                    var fields = batchRuns[run];
+                    var bits = MaskRunTest("mask", i % 32, fields.Count);
+                    var values = string.Join(", ", fields.Select(f => $"message.{f.Name}"));
+                    sb.AppendLine($"        if {bits}:");
+                    sb.AppendLine($"            writer.write_struct(_BATCH{run}, {values})");
+                    sb.AppendLine("        else:");
+                    foreach (var fieldInfo in fields.Select((f, j) => new { Field = f, Bit = (i + j) % 32 }))
+                    {
+                        sb.AppendLine($"            if {MaskBitTest("mask", fieldInfo.Bit)}:");
+                        sb.AppendLine($"                {GeneratePythonWriteField(fieldInfo.Field)}");
+                    }
+                    i += fields.Count - 1;
+                    continue;
+                }
+
+                var field = message.Fields[i];
+                var bitIndex = i % 32;
+                sb.AppendLine($"        if {MaskBitTest("mask", bitIndex)}:");
                 sb.AppendLine($"            {GeneratePythonWriteField(field)}");
             }
 
@@ -166,21 +250,49 @@ namespace BitRPC.Protocol.Generator
             sb.AppendLine($"        message = {message.Name}()");
             sb.AppendLine();
 
-            for (int group = 0; group < fieldGroups.Count; group++)
+            if (inlineMask)
             {
-                var fields = fieldGroups[group].ToList();
-                sb.AppendLine($"        # Read bit mask group {group}");
-                sb.AppendLine($"        mask{group} = BitMask()");
-                sb.AppendLine($"        mask{group}.read(reader)");
+                sb.AppendLine("        # Read bit mask group 0 (single group, plain int)");
+                sb.AppendLine("        reader.read_int32()  # word count, always 1 for <=32 fields");
+                sb.AppendLine("        mask0 = reader.read_uint32()");
                 sb.AppendLine();
             }
+            else
+            {
+                for (int group = 0; group < fieldGroups.Count; group++)
+                {
+                    var fields = fieldGroups[group].ToList();
+                    sb.AppendLine($"        # Read bit mask group {group}");
+                    sb.AppendLine($"        mask{group} = BitMask()");
+                    sb.AppendLine($"        mask{group}.read(reader)");
+                    sb.AppendLine();
+                }
+            }
 
-            foreach (var field in message.Fields)
+            for (int i = 0; i < message.Fields.Count; i++)
             {
-                var fieldIndex = message.Fields.IndexOf(field);
-                var groupIndex = fieldIndex / 32;
-                var bitIndex = fieldIndex % 32;
-                sb.AppendLine($"        if mask{groupIndex}.get_bit({bitIndex}):");
+                var run = batchRuns.FindIndex(r => message.Fields.IndexOf(r[0]) == i);
+                if (run >= 0)
+                {
+                    var fields = batchRuns[run];
+                    var bits = MaskRunTest("mask0", i % 32, fields.Count);
+                    var targets = string.Join(", ", fields.Select(f => $"message.{f.Name}"));
+                    sb.AppendLine($"        if {bits}:");
+                    sb.AppendLine($"            {targets} = reader.read_struct(_BATCH{run})");
+                    sb.AppendLine("        else:");
+                    foreach (var fieldInfo in fields.Select((f, j) => new { Field = f, Bit = (i + j) % 32 }))
+                    {
+                        sb.AppendLine($"            if {MaskBitTest("mask0", fieldInfo.Bit)}:");
+                        sb.AppendLine($"                {GeneratePythonReadField(fieldInfo.Field)}");
+                    }
+                    i += fields.Count - 1;
+                    continue;
+                }
+
+                var field = message.Fields[i];
+                var groupIndex = i / 32;
+                var bitIndex = i % 32;
+                sb.AppendLine($"        if {MaskBitTest($"mask{groupIndex}", bitIndex)}:");
                 sb.AppendLine($"            {GeneratePythonReadField(field)}");
             }
 
@@ -206,6 +318,7 @@ namespace BitRPC.Protocol.Generator
             var sb = new StringBuilder();
             sb.AppendLine(GenerateFileHeader("registry.py", options));
             sb.AppendLine($"from {runtimeBase}.serialization import BufferSerializer");
+            sb.AppendLine($"from {GetModelsImportPath(options)} import {string.Join(", ", definition.Messages.Select(m => m.Name))}");
             sb.AppendLine();
 
             foreach (var message in definition.Messages)
@@ -249,6 +362,13 @@ namespace BitRPC.Protocol.Generator
             sb.AppendLine($"from {importPath} import {string.Join(", ", service.Methods.Select(m => m.RequestType).Concat(service.Methods.Select(m => m.ResponseType)).Distinct())}");
             sb.AppendLine();
 
+            sb.AppendLine("# Method names pre-encoded once; call_async sends them without re-encoding");
+            foreach (var method in service.Methods)
+            {
+                sb.AppendLine($"_METHOD_{method.Name.ToUpper()} = b\"{service.Name}.{method.Name}\"");
+            }
+            sb.AppendLine();
+
             sb.AppendLine($"class {service.Name}Client(BaseClient):");
             sb.AppendLine($"    \"\"\"Client for {service.Name} service\"\"\"");
             sb.AppendLine();
@@ -258,7 +378,7 @@ namespace BitRPC.Protocol.Generator
 
             sb.AppendLine("    @classmethod");
             sb.AppendLine($"    def create_tcp_client(cls, host: str, port: int) -> '{service.Name}Client':");
-            sb.AppendLine("        \"\"\"Create a TCP client for the service\"");
+            sb.AppendLine("        \"\"\"Create a TCP client for the service\"\"\"");
             sb.AppendLine("        tcp_client = RpcClientFactory.create_tcp_client(host, port)");
             sb.AppendLine("        return cls(tcp_client)");
             sb.AppendLine();
@@ -267,7 +387,7 @@ namespace BitRPC.Protocol.Generator
             {
                 sb.AppendLine($"    async def {method.Name}_async(self, request: {method.RequestType}) -> {method.ResponseType}:");
                 sb.AppendLine($"        \"\"\"Call {method.Name} method\"\"\"");
-                sb.AppendLine($"        return await self.call_async(\"{service.Name}.{method.Name}\", request)");
+                sb.AppendLine($"        return await self.call_async(_METHOD_{method.Name.ToUpper()}, request)");
                 sb.AppendLine();
             }
 
@@ -351,7 +471,7 @@ namespace BitRPC.Protocol.Generator
 
             sb.AppendLine("    @classmethod");
             sb.AppendLine($"    def register_with_manager(cls, manager: ServiceManager) -> None:");
-            sb.AppendLine($"        \"\"\"Register this service with a service manager\"");
+            sb.AppendLine($"        \"\"\"Register this service with a service manager\"\"\"");
             sb.AppendLine($"        manager.register_service(cls())");
             sb.AppendLine();
 
@@ -380,11 +500,19 @@ namespace BitRPC.Protocol.Generator
             sb.AppendLine("class ProtocolFactory:");
             sb.AppendLine("    \"\"\"Factory for initializing protocol components\"\"\"");
             sb.AppendLine();
-            sb.AppendLine("    @staticmethod");
-            sb.AppendLine("    def initialize() -> None:");
-            sb.AppendLine("        \"\"\"Initialize protocol serializers and components\"\"\"");
+            sb.AppendLine("    _initialized = False");
+            sb.AppendLine();
+            sb.AppendLine("    @classmethod");
+            sb.AppendLine("    def initialize(cls) -> None:");
+            sb.AppendLine("        \"\"\"Initialize protocol serializers and components.");
+            sb.AppendLine();
+            sb.AppendLine("        Idempotent: callers may invoke this freely (e.g. once per client");
+            sb.AppendLine("        and per server); registration runs only on the first call.\"\"\"");
+            sb.AppendLine("        if cls._initialized:");
+            sb.AppendLine("            return");
             sb.AppendLine("        serializer = BufferSerializer.instance()");
             sb.AppendLine("        register_serializers(serializer)");
+            sb.AppendLine("        cls._initialized = True");
 
             return sb.ToString();
         }
@@ -406,6 +534,52 @@ namespace BitRPC.Protocol.Generator
             File.WriteAllText(filePath, sb.ToString());
         }
 
+        private List<List<ProtocolField>> GetPrimitiveBatchRuns(ProtocolMessage message)
+        {
+            // Runs of >=2 consecutive fixed-size scalar fields can be packed with
+            // a single struct call when all of them are present. Restricted to
+            // messages with one bit mask group so presence checks stay simple.
+            var runs = new List<List<ProtocolField>>();
+            if (message.Fields.Count > 32)
+            {
+                return runs;
+            }
+
+            var current = new List<ProtocolField>();
+            foreach (var field in message.Fields)
+            {
+                if (!field.IsRepeated && GetStructFormatChar(field.Type) != null)
+                {
+                    current.Add(field);
+                    continue;
+                }
+
+                if (current.Count >= 2)
+                {
+                    runs.Add(current);
+                }
+                current = new List<ProtocolField>();
+            }
+
+            if (current.Count >= 2)
+            {
+                runs.Add(current);
+            }
+            return runs;
+        }
+
+        private string GetStructFormatChar(FieldType type)
+        {
+            return type switch
+            {
+                FieldType.Int32 => "i",
+                FieldType.Int64 => "q",
+                FieldType.Float => "f",
+                FieldType.Double => "d",
+                _ => null
+            };
+        }
+
         private string GetPythonType(ProtocolField field)
         {
             if (field.IsRepeated)
@@ -467,12 +641,32 @@ namespace BitRPC.Protocol.Generator
         {
             if (field.IsRepeated)
             {
+                // Primitive lists go through the block write helpers instead
+                // of a Python call per element
+                var listSuffix = GetPrimitiveListSuffix(field.Type);
+                if (listSuffix != null)
+                {
+                    return $"writer.write_{listSuffix}_list(message.{field.Name})";
+                }
                 return $"writer.write_list(message.{field.Name}, lambda x: {GeneratePythonWriteValue(field.Type, "x")})";
             }
 
             return $"{GeneratePythonWriteValue(field.Type, $"message.{field.Name}")}";
         }
 
+        private string GetPrimitiveListSuffix(FieldType type)
+        {
+            return type switch
+            {
+                FieldType.Int32 => "int32",
+                FieldType.Int64 => "int64",
+                FieldType.Float => "float",
+                FieldType.Double => "double",
+                FieldType.String => "string",
+                _ => null
+            };
+        }
+
         private string GeneratePythonWriteValue(FieldType type, string value)
         {
             return type switch
@@ -491,6 +685,11 @@ namespace BitRPC.Protocol.Generator
         {
             if (field.IsRepeated)
             {
+                var listSuffix = GetPrimitiveListSuffix(field.Type);
+                if (listSuffix != null)
+                {
+                    return $"message.{field.Name} = reader.read_{listSuffix}_list()";
+                }
                 return $"message.{field.Name} = reader.read_list(lambda: {GeneratePythonReadValue(field.Type)})";
             }
 
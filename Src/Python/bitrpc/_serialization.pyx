@@ -0,0 +1,334 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Cython-accelerated StreamWriter/StreamReader.
+
+Optional drop-in replacement for the pure-Python classes in
+serialization.py; build with `cythonize -i _serialization.pyx` and
+enable with BITRPC_CYTHON=1. The wire format is identical
+(little-endian, length-prefixed strings and lists). Little-endian
+hosts only: the scalar paths memcpy values in native byte order, so
+on a big-endian host the import is refused and serialization.py
+falls back to the pure-Python streams, which byteswap where needed."""
+
+from libc.string cimport memcpy
+import array
+import sys
+from datetime import datetime, timedelta, timezone
+
+if sys.byteorder != 'little':
+    raise ImportError("bitrpc._serialization requires a little-endian host")
+
+cdef object _EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# The shared BufferSerializer, resolved lazily: serialization.py imports
+# this module while it is itself still being imported
+cdef object _serializer_instance = None
+
+cdef inline object _get_serializer():
+    global _serializer_instance
+    if _serializer_instance is None:
+        from .serialization import _SERIALIZER
+        _serializer_instance = _SERIALIZER
+    return _serializer_instance
+
+
+cdef class StreamWriter:
+    cdef bytearray buffer
+    cdef Py_ssize_t pos
+
+    def __init__(self, Py_ssize_t initial_size=256):
+        self.buffer = bytearray(initial_size)
+        self.pos = 0
+
+    cdef inline void _ensure(self, Py_ssize_t n):
+        cdef Py_ssize_t cap = len(self.buffer)
+        cdef Py_ssize_t need = self.pos + n - cap
+        if need > 0:
+            self.buffer.extend(b'\x00' * (cap if cap > need else need))
+
+    cpdef _append(self, data):
+        # Pre-packed bytes from callers that batch with struct.pack
+        # (BitMask.write, the compiled dataclass writers)
+        cdef Py_ssize_t length = len(data)
+        self._ensure(length)
+        self.buffer[self.pos:self.pos + length] = data
+        self.pos += length
+
+    cpdef write_int32(self, int value):
+        self._ensure(4)
+        cdef unsigned char[:] buf = self.buffer
+        memcpy(&buf[self.pos], &value, 4)
+        self.pos += 4
+
+    cpdef write_uint32(self, unsigned int value):
+        self._ensure(4)
+        cdef unsigned char[:] buf = self.buffer
+        memcpy(&buf[self.pos], &value, 4)
+        self.pos += 4
+
+    cpdef write_int64(self, long long value):
+        self._ensure(8)
+        cdef unsigned char[:] buf = self.buffer
+        memcpy(&buf[self.pos], &value, 8)
+        self.pos += 8
+
+    cpdef write_float(self, float value):
+        self._ensure(4)
+        cdef unsigned char[:] buf = self.buffer
+        memcpy(&buf[self.pos], &value, 4)
+        self.pos += 4
+
+    cpdef write_double(self, double value):
+        self._ensure(8)
+        cdef unsigned char[:] buf = self.buffer
+        memcpy(&buf[self.pos], &value, 8)
+        self.pos += 8
+
+    cpdef write_bool(self, bint value):
+        self.write_int32(1 if value else 0)
+
+    cpdef write_string(self, value):
+        if value is None:
+            self.write_int32(-1)
+        elif value == "":
+            self.write_int32(0)
+        else:
+            self._write_block(value.encode('utf-8'))
+
+    cpdef write_bytes(self, value):
+        if value is None:
+            self.write_int32(-1)
+        else:
+            self._write_block(value)
+
+    cdef _write_block(self, data):
+        # Any bytes-like object, as the pure-Python writer accepts
+        cdef const unsigned char[:] src = data
+        cdef Py_ssize_t length = src.shape[0]
+        cdef unsigned char[:] buf
+        self.write_int32(<int>length)
+        self._ensure(length)
+        buf = self.buffer
+        if length > 0:
+            memcpy(&buf[self.pos], &src[0], length)
+        self.pos += length
+
+    def write_struct(self, fmt, *values):
+        # def rather than cpdef: cpdef methods cannot take *args
+        cdef Py_ssize_t size = fmt.size
+        self._ensure(size)
+        fmt.pack_into(self.buffer, self.pos, *values)
+        self.pos += size
+
+    cpdef write_list(self, value, write_func):
+        if value is None:
+            self.write_int32(-1)
+        else:
+            self.write_int32(len(value))
+            for item in value:
+                write_func(item)
+
+    cdef _write_primitive_list(self, value, str typecode, Py_ssize_t item_size):
+        cdef Py_ssize_t nbytes
+        if value is None:
+            self.write_int32(-1)
+            return
+        arr = array.array(typecode, value)
+        nbytes = item_size * len(value)
+        self.write_int32(<int>len(value))
+        self._ensure(nbytes)
+        self.buffer[self.pos:self.pos + nbytes] = memoryview(arr).cast('B')
+        self.pos += nbytes
+
+    cpdef write_int32_list(self, value):
+        self._write_primitive_list(value, 'i', 4)
+
+    cpdef write_int64_list(self, value):
+        self._write_primitive_list(value, 'q', 8)
+
+    cpdef write_float_list(self, value):
+        self._write_primitive_list(value, 'f', 4)
+
+    cpdef write_double_list(self, value):
+        self._write_primitive_list(value, 'd', 8)
+
+    cpdef write_int32_array(self, values):
+        self._write_primitive_list(values, 'i', 4)
+
+    cpdef write_string_list(self, value):
+        # Per-element loop; wire-compatible with the pure-Python batch
+        if value is None:
+            self.write_int32(-1)
+            return
+        self.write_int32(len(value))
+        for item in value:
+            self.write_string(item)
+
+    cpdef write_datetime(self, value):
+        if value is None:
+            self.write_int64(-1)
+        elif value.tzinfo is not None:
+            # Timedelta arithmetic from the epoch is cheaper than
+            # timestamp() for aware values; naive values keep the
+            # local-time interpretation used by read_datetime
+            delta = value - _EPOCH
+            self.write_int64(delta.days * 86_400_000 + delta.seconds * 1000
+                             + delta.microseconds // 1000)
+        else:
+            self.write_int64(<long long>(value.timestamp() * 1000))
+
+    def write_object(self, obj):
+        _get_serializer().write_object(obj, self)
+
+    cpdef to_bytes(self):
+        return bytes(memoryview(self.buffer)[:self.pos])
+
+    cpdef as_buffer(self):
+        # Zero-copy view; valid until the next write or reset
+        return memoryview(self.buffer)[:self.pos]
+
+    cpdef to_iovecs(self):
+        # Chunk list for writelines/sendmsg; aliases the buffer like
+        # as_buffer does
+        return [memoryview(self.buffer)[:self.pos]]
+
+    cpdef reset(self):
+        self.pos = 0
+
+
+cdef class StreamReader:
+    cdef object data
+    cdef const unsigned char[:] view
+    # Plain memoryview for callers that unpack_from the buffer directly
+    # (BitMask.read, the batched list codes in deserialize)
+    cdef readonly object _view
+    cdef public Py_ssize_t position
+
+    def __init__(self, data):
+        self.data = data
+        self.view = data
+        self._view = memoryview(data)
+        self.position = 0
+
+    cdef inline void _check(self, Py_ssize_t n) except *:
+        if self.position + n > self.view.shape[0]:
+            raise ValueError("Unexpected end of stream")
+
+    cpdef int read_int32(self) except? -1:
+        self._check(4)
+        cdef int value
+        memcpy(&value, &self.view[self.position], 4)
+        self.position += 4
+        return value
+
+    cpdef unsigned int read_uint32(self) except? 0xFFFFFFFF:
+        self._check(4)
+        cdef unsigned int value
+        memcpy(&value, &self.view[self.position], 4)
+        self.position += 4
+        return value
+
+    cpdef long long read_int64(self) except? -1:
+        self._check(8)
+        cdef long long value
+        memcpy(&value, &self.view[self.position], 8)
+        self.position += 8
+        return value
+
+    cpdef float read_float(self) except? -1.0:
+        self._check(4)
+        cdef float value
+        memcpy(&value, &self.view[self.position], 4)
+        self.position += 4
+        return value
+
+    cpdef double read_double(self) except? -1.0:
+        self._check(8)
+        cdef double value
+        memcpy(&value, &self.view[self.position], 8)
+        self.position += 8
+        return value
+
+    cpdef bint read_bool(self) except? False:
+        return self.read_int32() != 0
+
+    cpdef read_string(self):
+        cdef int length = self.read_int32()
+        if length == -1:
+            return None
+        if length == 0:
+            return ""
+        self._check(length)
+        value = bytes(self.view[self.position:self.position + length]).decode('utf-8')
+        self.position += length
+        return value
+
+    cpdef read_bytes(self):
+        cdef int length = self.read_int32()
+        if length == -1:
+            return None
+        self._check(length)
+        value = bytes(self.view[self.position:self.position + length])
+        self.position += length
+        return value
+
+    cpdef read_bytes_view(self):
+        # Zero-copy slice; borrows the reader's buffer
+        cdef int length = self.read_int32()
+        if length == -1:
+            return None
+        self._check(length)
+        value = self._view[self.position:self.position + length]
+        self.position += length
+        return value
+
+    cpdef read_struct(self, fmt):
+        cdef Py_ssize_t size = fmt.size
+        self._check(size)
+        values = fmt.unpack_from(self._view, self.position)
+        self.position += size
+        return values
+
+    cdef _read_primitive_list(self, str typecode, Py_ssize_t item_size):
+        cdef int length = self.read_int32()
+        cdef Py_ssize_t nbytes
+        if length == -1:
+            return None
+        nbytes = item_size * length
+        self._check(nbytes)
+        arr = array.array(typecode)
+        arr.frombytes(self._view[self.position:self.position + nbytes])
+        self.position += nbytes
+        return arr.tolist()
+
+    cpdef read_int32_list(self):
+        return self._read_primitive_list('i', 4)
+
+    cpdef read_int64_list(self):
+        return self._read_primitive_list('q', 8)
+
+    cpdef read_float_list(self):
+        return self._read_primitive_list('f', 4)
+
+    cpdef read_double_list(self):
+        return self._read_primitive_list('d', 8)
+
+    cpdef read_string_list(self):
+        cdef int count = self.read_int32()
+        if count == -1:
+            return None
+        return [self.read_string() for _ in range(count)]
+
+    cpdef read_list(self, read_func):
+        cdef int length = self.read_int32()
+        if length == -1:
+            return None
+        return [read_func() for _ in range(length)]
+
+    def read_object(self):
+        return _get_serializer().read_object(self)
+
+    cpdef read_datetime(self):
+        cdef long long timestamp = self.read_int64()
+        if timestamp == -1:
+            return None
+        return datetime.fromtimestamp(timestamp / 1000)
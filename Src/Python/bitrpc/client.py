@@ -1,13 +1,31 @@
 import asyncio
 import struct
 import socket
-from typing import Any, TypeVar, Generic, Callable, Optional
+from typing import Any, TypeVar, Generic, Callable, Optional, Union
 from abc import ABC, abstractmethod
-from .serialization import BufferSerializer, StreamWriter, StreamReader
+from .serialization import BufferSerializer, StreamWriter, StreamReader, writer_pool
 
 T = TypeVar('T')
 R = TypeVar('R')
 
+# Pre-compiled frame header format (little-endian uint32)
+_U32 = struct.Struct('<I')
+
+def _tune_socket(sock: socket.socket) -> None:
+    """Tune a connected socket for ping-pong RPC traffic.
+
+    Disables Nagle so small request frames go out immediately and sizes
+    the kernel buffers so large frames do not stall the event loop on
+    partial sends. TCP_QUICKACK is deliberately not set: Linux clears
+    it again after subsequent ACK events, so a one-time setsockopt at
+    connect would only affect the first exchanges."""
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+    except OSError:
+        pass
+
 class IRpcClient(ABC):
     """Interface for RPC clients"""
 
@@ -35,20 +53,42 @@ class IRpcClient(ABC):
 class TcpRpcClient(IRpcClient):
     """TCP-based RPC client implementation"""
 
-    def __init__(self, host: str, port: int, serializer: Optional[BufferSerializer] = None):
+    def __init__(self, host: str, port: int, serializer: Optional[BufferSerializer] = None,
+                 use_raw_socket: bool = False):
         self.host = host
         self.port = port
         self.reader = None
         self.writer = None
-        self._serializer = serializer or BufferSerializer()
+        # Default to the shared serializer so handler registrations (and
+        # cache warmth) are common to every client in the process
+        self._serializer = serializer or BufferSerializer.instance()
         self._connected = False
+        # Raw-socket mode skips asyncio's stream layer: responses are
+        # received into a preallocated buffer instead of a fresh bytes
+        # object per call; same wire format.
+        self._use_raw_socket = use_raw_socket
+        self._sock: Optional[socket.socket] = None
+        self._recv_buffer = bytearray(4096)
 
     async def connect_async(self):
         """Connect to the RPC server"""
         if self._connected:
             return
 
-        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        if self._use_raw_socket:
+            loop = asyncio.get_running_loop()
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            _tune_socket(sock)
+            await loop.sock_connect(sock, (self.host, self.port))
+            self._sock = sock
+        else:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+            sock = self.writer.get_extra_info('socket')
+            if sock is not None:
+                _tune_socket(sock)
+
         self._connected = True
 
     async def disconnect_async(self):
@@ -56,39 +96,90 @@ class TcpRpcClient(IRpcClient):
         if self.writer:
             self.writer.close()
             await self.writer.wait_closed()
+        if self._sock:
+            self._sock.close()
+            self._sock = None
         self.reader = None
         self.writer = None
         self._connected = False
 
-    async def call_async(self, method: str, request: Any) -> Any:
-        """Call a remote method"""
+    async def _recv_exactly(self, n: int) -> memoryview:
+        """Read exactly n bytes from the raw socket into the reused buffer"""
+        if len(self._recv_buffer) < n:
+            self._recv_buffer = bytearray(n)
+        loop = asyncio.get_running_loop()
+        view = memoryview(self._recv_buffer)
+        received = 0
+        while received < n:
+            count = await loop.sock_recv_into(self._sock, view[received:n])
+            if count == 0:
+                raise ConnectionError("Connection closed by server")
+            received += count
+        return view[:n]
+
+    async def call_async(self, method: Union[str, bytes], request: Any) -> Any:
+        """Call a remote method.
+
+        Generated stubs pass the method name as pre-encoded bytes so the
+        UTF-8 encode is not repeated on every call."""
         if not self._connected:
             raise ConnectionError("Client is not connected")
 
         try:
-            # Serialize the request
-            request_writer = StreamWriter()
-            self._serializer.serialize(request, request_writer)
-            request_data = request_writer.to_bytes()
-
-            # Create the message: method_length + method_data + request_length + request_data
-            method_data = method.encode('utf-8')
-            message = (
-                struct.pack('I', len(method_data)) +
-                method_data +
-                struct.pack('I', len(request_data)) +
-                request_data
-            )
-
-            # Send the message
-            self.writer.write(struct.pack('I', len(message)))
-            self.writer.write(message)
-            await self.writer.drain()
-
-            # Read the response
-            response_length_data = await self.reader.readexactly(4)
-            response_length = struct.unpack('I', response_length_data)[0]
-            response_data = await self.reader.readexactly(response_length)
+            # Serialize the request into a pooled writer; the buffer is
+            # reused across calls on this thread instead of being
+            # reallocated and collected per RPC. The writer is held until
+            # the response arrives: the transport may reference the body
+            # view until the frame is fully flushed.
+            request_writer = writer_pool.acquire()
+            try:
+                self._serializer.serialize(request, request_writer)
+
+                method_data = method if isinstance(method, bytes) else method.encode('utf-8')
+                method_length = len(method_data)
+
+                if self._sock is not None:
+                    # Raw-socket path: build one contiguous frame, then
+                    # sendall + recv_into the reused buffer — no stream
+                    # layer allocation per response
+                    body = request_writer.as_buffer()
+                    request_length = len(body)
+                    frame = bytearray(12 + method_length + request_length)
+                    _U32.pack_into(frame, 0, 8 + method_length + request_length)
+                    _U32.pack_into(frame, 4, method_length)
+                    frame[8:8 + method_length] = method_data
+                    _U32.pack_into(frame, 8 + method_length, request_length)
+                    frame[12 + method_length:] = body
+
+                    loop = asyncio.get_running_loop()
+                    await loop.sock_sendall(self._sock, frame)
+                    response_length = _U32.unpack(await self._recv_exactly(4))[0]
+                    # Safe to hand the view straight to StreamReader: it
+                    # is consumed below, before the buffer is reused
+                    response_data = await self._recv_exactly(response_length)
+                else:
+                    # Scatter-gather send: one header chunk plus a zero-copy
+                    # view of the serialized body, so the payload is never
+                    # concatenated. The outer length prefix stays: the C# and
+                    # C++ servers frame on it, even though it is derivable
+                    # from the inner lengths.
+                    body = request_writer.as_buffer()
+                    request_length = len(body)
+                    header = bytearray(12 + method_length)
+                    _U32.pack_into(header, 0, 8 + method_length + request_length)
+                    _U32.pack_into(header, 4, method_length)
+                    header[8:8 + method_length] = method_data
+                    _U32.pack_into(header, 8 + method_length, request_length)
+
+                    self.writer.writelines([header, body])
+                    await self.writer.drain()
+
+                    # Read the response
+                    response_length_data = await self.reader.readexactly(4)
+                    response_length = _U32.unpack(response_length_data)[0]
+                    response_data = await self.reader.readexactly(response_length)
+            finally:
+                writer_pool.release(request_writer)
 
             # Deserialize the response
             response_reader = StreamReader(response_data)
@@ -104,6 +195,54 @@ class TcpRpcClient(IRpcClient):
         """Check if client is connected"""
         return self._connected
 
+class TcpRpcClientPool(IRpcClient):
+    """Pool of TCP connections for safe concurrent RPC calls.
+
+    A single TcpRpcClient serializes calls head-of-line because requests
+    and responses share one connection; the pool lends each in-flight
+    call its own connection so concurrent calls cannot interleave frames."""
+
+    def __init__(self, host: str, port: int, size: int = 8, serializer: Optional[BufferSerializer] = None):
+        self.host = host
+        self.port = port
+        self._clients = [TcpRpcClient(host, port, serializer) for _ in range(size)]
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._connected = False
+
+    async def connect_async(self):
+        """Connect all pooled connections"""
+        if self._connected:
+            return
+
+        for client in self._clients:
+            await client.connect_async()
+            self._queue.put_nowait(client)
+        self._connected = True
+
+    async def disconnect_async(self):
+        """Disconnect all pooled connections"""
+        for client in self._clients:
+            await client.disconnect_async()
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._connected = False
+
+    async def call_async(self, method: str, request: Any) -> Any:
+        """Call a remote method on the next free connection"""
+        if not self._connected:
+            raise ConnectionError("Client is not connected")
+
+        client = await self._queue.get()
+        try:
+            return await client.call_async(method, request)
+        finally:
+            self._queue.put_nowait(client)
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the pool is connected"""
+        return self._connected
+
 class BaseClient:
     """Base class for service clients"""
 
@@ -136,9 +275,16 @@ class RpcClientFactory:
     """Factory for creating RPC clients"""
 
     @staticmethod
-    def create_tcp_client(host: str, port: int, serializer: Optional[BufferSerializer] = None) -> TcpRpcClient:
+    def create_tcp_client(host: str, port: int, serializer: Optional[BufferSerializer] = None,
+                          use_raw_socket: bool = False) -> TcpRpcClient:
         """Create a TCP RPC client"""
-        return TcpRpcClient(host, port, serializer)
+        return TcpRpcClient(host, port, serializer, use_raw_socket)
+
+    @staticmethod
+    def create_tcp_client_pool(host: str, port: int, size: int = 8,
+                               serializer: Optional[BufferSerializer] = None) -> TcpRpcClientPool:
+        """Create a pooled TCP RPC client for concurrent callers"""
+        return TcpRpcClientPool(host, port, size, serializer)
 
     @staticmethod
     def create_base_client(client: IRpcClient) -> BaseClient:
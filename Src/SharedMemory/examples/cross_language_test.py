@@ -7,6 +7,7 @@ import sys
 import time
 import threading
 import struct
+import asyncio
 import argparse
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
@@ -22,6 +23,11 @@ except ImportError:
     print("无法导入共享内存API，请确保库已正确安装")
     sys.exit(1)
 
+# 预编译的TestData打包格式: i (int), d (double), 64s (64字节字符串),
+# Q (ulong). 避免每次pack/unpack重新解析格式串
+_TD_STRUCT = struct.Struct('<id64sQ')
+_TD_SIZE = _TD_STRUCT.size
+
 # 测试数据结构
 @dataclass
 class TestData:
@@ -32,17 +38,31 @@ class TestData:
 
     def pack(self) -> bytes:
         """将结构打包为字节"""
-        # 打包格式: i (int), d (double), 64s (64字节字符串), Q (ulong)
-        message_bytes = self.message.encode('utf-8').ljust(64, b'\x00')
-        return struct.pack('<id64sQ', self.id, self.value, message_bytes, self.timestamp)
+        # 64s格式自动补零, 无需ljust产生的中间拷贝
+        return _TD_STRUCT.pack(self.id, self.value,
+                               self.message.encode('utf-8')[:64], self.timestamp)
 
     @classmethod
     def unpack(cls, data: bytes) -> 'TestData':
         """从字节解包结构"""
-        id_val, value, message_bytes, timestamp = struct.unpack('<id64sQ', data)
+        id_val, value, message_bytes, timestamp = _TD_STRUCT.unpack_from(data, 0)
         message = message_bytes.decode('utf-8').rstrip('\x00')
         return cls(id=id_val, value=value, message=message, timestamp=timestamp)
 
+    @classmethod
+    def unpack_batch(cls, data) -> list:
+        """批量解包首尾相接的TestData记录.
+
+        iter_unpack在C层按记录大小步进, 整批只有一次解析调用分发,
+        而不是每条记录各付一次unpack的Python调用开销; 末尾不足一条
+        记录的字节忽略."""
+        usable = len(data) - len(data) % _TD_SIZE
+        return [cls(id=id_val, value=value,
+                    message=message_bytes.decode('utf-8').rstrip('\x00'),
+                    timestamp=timestamp)
+                for id_val, value, message_bytes, timestamp
+                in _TD_STRUCT.iter_unpack(memoryview(data)[:usable])]
+
 class CrossLanguageTestProducer:
     def __init__(self, name: str = "CrossLangTest"):
         self.name = name
@@ -65,8 +85,9 @@ class CrossLanguageTestProducer:
             print(f"✓ Python Producer connected to shared memory: {self.name}")
             self.running = True
 
-            # 启动发送线程
-            self.send_thread = threading.Thread(target=self.send_loop)
+            # 发送线程里跑事件循环: 节奏控制交给asyncio定时器, 多个
+            # 待定睡眠合并为一次OS级等待, 而不是串行的time.sleep
+            self.send_thread = threading.Thread(target=self._run_send_loop)
             self.send_thread.daemon = True
             self.send_thread.start()
 
@@ -95,7 +116,10 @@ class CrossLanguageTestProducer:
     def is_running(self) -> bool:
         return self.running
 
-    def send_loop(self):
+    def _run_send_loop(self):
+        asyncio.run(self.send_loop())
+
+    async def send_loop(self):
         """发送循环"""
         counter = 0
 
@@ -106,14 +130,14 @@ class CrossLanguageTestProducer:
                 if self.producer.send_string(text_message):
                     print(f"Sent text: {text_message}")
 
-                time.sleep(0.1)
+                await asyncio.sleep(0.1)
 
                 # 发送结构化数据
                 data = TestData(
                     id=counter,
                     value=1.41421 * counter,
                     message=f"Python Data #{counter}",
-                    timestamp=int(time.time() * 1000)
+                    timestamp=time.time_ns() // 1_000_000
                 )
 
                 message = SharedMemoryMessage(MessageType.DATA, data.pack())
@@ -130,11 +154,11 @@ class CrossLanguageTestProducer:
                 counter += 1
 
                 # 等待一段时间
-                time.sleep(0.5)
+                await asyncio.sleep(0.5)
 
             except Exception as e:
                 print(f"Error in send loop: {e}")
-                time.sleep(1)
+                await asyncio.sleep(1)
 
 class CrossLanguageTestConsumer:
     def __init__(self, name: str = "CrossLangTest"):
@@ -143,6 +167,9 @@ class CrossLanguageTestConsumer:
         self.consumer: Optional[SharedMemoryConsumer] = None
         self.receive_thread: Optional[threading.Thread] = None
         self.message_handlers: Dict[MessageType, callable] = {}
+        # 常见消息类型的处理器按类型值索引, 热路径上是一次列表取值
+        # 而不是字典查找; 超出范围的类型(如CUSTOM_MIN)走字典
+        self._dispatch: list = [None] * 16
 
     def start(self) -> bool:
         """启动消费者"""
@@ -164,7 +191,8 @@ class CrossLanguageTestConsumer:
             print(f"✓ Python Consumer connected to shared memory: {self.name}")
             self.running = True
 
-            # 启动接收线程
+            # 专用接收线程直接轮询: 只有一条接收路径, 事件循环和
+            # 执行器转发只会增加每次接收的线程切换
             self.receive_thread = threading.Thread(target=self.receive_loop)
             self.receive_thread.daemon = True
             self.receive_thread.start()
@@ -197,13 +225,15 @@ class CrossLanguageTestConsumer:
     def register_message_handler(self, message_type: MessageType, handler: callable):
         """注册消息处理器"""
         self.message_handlers[message_type] = handler
+        if 0 <= message_type < len(self._dispatch):
+            self._dispatch[message_type] = handler
 
     def handle_data_message(self, message: SharedMemoryMessage) -> bool:
         """处理数据消息"""
-        print(f"Received data message: {message.payload_size} bytes")
+        print(f"Received data message: {len(message.payload)} bytes")
 
         # 尝试解析为TestData结构
-        if message.payload_size == struct.calcsize('<id64sQ'):
+        if len(message.payload) == _TD_SIZE:
             try:
                 data = TestData.unpack(message.payload)
                 print(f"  Parsed data: id={data.id}, value={data.value}, "
@@ -229,32 +259,27 @@ class CrossLanguageTestConsumer:
 
     def receive_loop(self):
         """接收循环"""
+        # 生产者只发送带头的消息, 旧的receive_string/receive回退路径
+        # 每个空闲周期平添两次FFI, 这里只保留单一接收路径
+        dispatch = self._dispatch
+        dispatch_len = len(dispatch)
         while self.running:
             try:
-                # 尝试接收消息
                 message = self.consumer.receive_message(100)  # 100ms timeout
-                if message:
-                    handler = self.message_handlers.get(message.message_type)
-                    if handler:
-                        handler(message)
-                    else:
-                        print(f"Received unhandled message type: {message.message_type}")
-                    continue
-
-                # 尝试接收字符串
-                text = self.consumer.receive_string(100)
-                if text is not None:
-                    print(f"Received string: {text}")
-                    continue
-
-                # 尝试接收原始数据
-                data = self.consumer.receive(100)
-                if data is not None:
-                    print(f"Received raw data: {len(data)} bytes")
+                if message is None:
+                    # RB_Read本身不阻塞, 空闲时仍需短暂休眠避免空转
+                    time.sleep(0.05)
                     continue
 
-                # 如果没有数据，短暂休眠
-                time.sleep(0.05)
+                message_type = message.message_type
+                if 0 <= message_type < dispatch_len:
+                    handler = dispatch[message_type]
+                else:
+                    handler = self.message_handlers.get(message_type)
+                if handler:
+                    handler(message)
+                else:
+                    print(f"Received unhandled message type: {message_type}")
 
             except Exception as e:
                 print(f"Error in receive loop: {e}")
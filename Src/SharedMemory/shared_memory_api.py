@@ -4,23 +4,43 @@ BitRPC Shared Memory Python API
 """
 
 import ctypes
-import threading
+import itertools
+import os
+import pickle
+import platform
 import time
 from typing import Optional, List, Tuple, Callable, Any, Union
 from enum import IntEnum
 from dataclasses import dataclass
 import struct
 
-# 加载共享库
+# 按平台直接选择库文件名, 不再靠捕获OSError逐个试探加载(非Windows上
+# 每次导入都白付一次异常开销, 还会吞掉真正的加载错误). 库文件与本
+# 模块同目录; RTLD_LOCAL避免符号进入全局命名空间
+_LIB_NAMES = {
+    'Windows': 'SharedMemoryNative.dll',
+    'Linux': 'libSharedMemoryNative.so',
+    'Darwin': 'libSharedMemoryNative.dylib',
+}
+
+_lib_name = _LIB_NAMES.get(platform.system())
+if _lib_name is None:
+    raise RuntimeError(f"Unsupported platform: {platform.system()}")
 try:
-    # Windows
-    _lib = ctypes.CDLL("./SharedMemoryNative.dll")
-except:
+    _lib = ctypes.CDLL(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), _lib_name),
+        mode=ctypes.RTLD_LOCAL)
+except OSError as e:
+    raise RuntimeError(f"Cannot load shared memory native library: {e}")
+
+# 可选的Cython绑定(shared_memory_native.pyx): 直接声明C原型, 省去ctypes
+# 每次调用的参数封送. 不可用时热路径自动走ctypes.
+_native = None
+if os.environ.get('BITRPC_CYTHON') == '1':
     try:
-        # Linux/Mac
-        _lib = ctypes.CDLL("./libSharedMemoryNative.so")
-    except:
-        raise RuntimeError("Cannot load shared memory native library")
+        import shared_memory_native as _native
+    except ImportError:
+        _native = None
 
 # 定义消息类型
 class MessageType(IntEnum):
@@ -38,6 +58,13 @@ class MessageFlags(IntEnum):
     ENCRYPTED = 0x04
     LAST_FRAGMENT = 0x08
 
+# 消息头wire格式, 与C#的MessageHeader(Pack=1)一致:
+# uint32 id, uint32 type, uint32 payload_size, uint64 timestamp,
+# uint8 flags, 3字节保留, 共24字节. 预编译Struct避免每次调用
+# 重新解析格式串.
+_HDR = struct.Struct('<IIIQB3x')
+HEADER_SIZE = _HDR.size  # 24
+
 # 消息头结构
 @dataclass
 class MessageHeader:
@@ -49,85 +76,129 @@ class MessageHeader:
 
     def pack(self) -> bytes:
         """打包消息头为字节"""
-        return struct.pack('<IIIIBxxx',
-                          self.message_id,
-                          self.message_type,
-                          self.payload_size,
-                          self.timestamp,
-                          self.flags)
+        return _HDR.pack(self.message_id,
+                         self.message_type,
+                         self.payload_size,
+                         self.timestamp,
+                         self.flags)
 
     @classmethod
     def unpack(cls, data: bytes) -> 'MessageHeader':
         """从字节解包消息头"""
-        if len(data) < 16:  # 消息头固定16字节
+        if len(data) < HEADER_SIZE:
             raise ValueError("Invalid message header data")
 
-        message_id, message_type, payload_size, timestamp, flags = struct.unpack('<IIIIBxxx', data[:16])
-        return cls(message_id, message_type, payload_size, timestamp, flags)
+        return cls(*_HDR.unpack_from(data, 0))
 
 # 共享内存消息类
 class SharedMemoryMessage:
-    _next_id = 1
-    _id_lock = threading.Lock()
+    # itertools.count的__next__在GIL下本身就是原子的, 无需加锁
+    _id_counter = itertools.count(1)
+    # 固定结构消息的schema注册表: 类型 -> (头+负载合并的Struct, 负载大小).
+    # '<'前缀保证无对齐填充, 合并格式的wire布局与头、负载分两段写入
+    # 完全一致
+    _schemas: dict = {}
 
-    def __init__(self, message_type: MessageType = MessageType.DATA, payload: bytes = b''):
-        with self._id_lock:
-            self.message_id = SharedMemoryMessage._next_id
-            SharedMemoryMessage._next_id += 1
+    @classmethod
+    def register_schema(cls, message_type: int, body_fmt: str) -> struct.Struct:
+        """为固定结构的消息类型注册负载格式(struct格式串, 不含'<').
 
+        注册后生产者可用send_values一次pack完成头+负载序列化,
+        消费者可用receive_values一次unpack还原字段值."""
+        full = struct.Struct('<IIIQB3x' + body_fmt)
+        cls._schemas[int(message_type)] = (full, full.size - HEADER_SIZE)
+        return full
+
+    def __init__(self, message_type: MessageType = MessageType.DATA, payload: bytes = b''):
+        self.message_id = next(SharedMemoryMessage._id_counter)
         self.message_type = message_type
         self.payload = payload or b''
-        self.timestamp = int(time.time() * 1000)  # 毫秒时间戳
-        self.flags = MessageFlags.NONE
+        self.timestamp = time.time_ns() // 1_000_000  # 毫秒时间戳
+        # flags保持普通int: IntEnum的位运算经过__and__/__or__类型分派,
+        # 比纯整数运算慢, 而set_flag/has_flag在每次收发都会调用
+        self.flags = 0
+
+    def serialize_into(self, out: bytearray, offset: int = 0) -> int:
+        """序列化消息到out缓冲区, 返回写入后的偏移.
+
+        头和负载直接写入目标缓冲区, 无中间分配; 调用方负责保证
+        out从offset起至少有total_size字节."""
+        payload = self.payload
+        _HDR.pack_into(out, offset,
+                       self.message_id,
+                       self.message_type,
+                       len(payload),
+                       self.timestamp,
+                       self.flags)
+        end = offset + HEADER_SIZE + len(payload)
+        out[offset + HEADER_SIZE:end] = payload
+        return end
 
     def serialize(self) -> bytes:
         """序列化消息为字节"""
-        header = MessageHeader(
-            message_id=self.message_id,
-            message_type=self.message_type,
-            payload_size=len(self.payload),
-            timestamp=self.timestamp,
-            flags=self.flags
-        )
-        return header.pack() + self.payload
+        buf = bytearray(self.total_size)
+        self.serialize_into(buf, 0)
+        return bytes(buf)
 
     @classmethod
     def deserialize(cls, data: bytes) -> 'SharedMemoryMessage':
-        """从字节反序列化消息"""
-        if len(data) < 16:
+        """从字节反序列化消息. data可为bytes或memoryview"""
+        if len(data) < HEADER_SIZE:
             raise ValueError("Invalid message data")
 
-        header = MessageHeader.unpack(data)
+        message_id, message_type, payload_size, timestamp, flags = _HDR.unpack_from(data, 0)
 
-        if header.payload_size > len(data) - 16:
+        if payload_size > len(data) - HEADER_SIZE:
             raise ValueError("Payload size mismatch")
 
-        payload = data[16:16+header.payload_size]
+        payload = bytes(memoryview(data)[HEADER_SIZE:HEADER_SIZE + payload_size])
 
         message = cls()
-        message.message_id = header.message_id
-        message.message_type = header.message_type
+        message.message_id = message_id
+        message.message_type = message_type
         message.payload = payload
-        message.timestamp = header.timestamp
-        message.flags = header.flags
+        message.timestamp = timestamp
+        message.flags = flags
 
         return message
 
+    @classmethod
+    def _fast_deserialize(cls, data) -> 'SharedMemoryMessage':
+        """deserialize的接收热路径变体.
+
+        用object.__new__跳过__init__ —— 其中的ID分配和取时间戳都会
+        被头部字段立即覆盖, 纯属浪费; 字段直接从unpack结果赋值."""
+        if len(data) < HEADER_SIZE:
+            raise ValueError("Invalid message data")
+
+        message = object.__new__(cls)
+        (message.message_id, message.message_type, payload_size,
+         message.timestamp, message.flags) = _HDR.unpack_from(data, 0)
+
+        if payload_size > len(data) - HEADER_SIZE:
+            raise ValueError("Payload size mismatch")
+
+        message.payload = bytes(memoryview(data)[HEADER_SIZE:HEADER_SIZE + payload_size])
+        return message
+
     def has_flag(self, flag: MessageFlags) -> bool:
         """检查是否有指定标志"""
-        return (self.flags & flag) != 0
+        return (self.flags & int(flag)) != 0
 
     def set_flag(self, flag: MessageFlags):
         """设置标志"""
-        self.flags |= flag
+        self.flags |= int(flag)
 
     @property
     def total_size(self) -> int:
         """消息总大小"""
-        return 16 + len(self.payload)
+        return HEADER_SIZE + len(self.payload)
 
 # 定义C函数接口
 class NativeMethods:
+    # 暴露库句柄供各调用点使用(NativeMethods._lib.X)
+    _lib = _lib
+
     # 环形缓冲区API
     _lib.RB_CreateProducer.argtypes = [ctypes.c_char_p, ctypes.c_size_t]
     _lib.RB_CreateProducer.restype = ctypes.c_void_p
@@ -138,7 +209,9 @@ class NativeMethods:
     _lib.RB_Close.argtypes = [ctypes.c_void_p]
     _lib.RB_Close.restype = None
 
-    _lib.RB_Write.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t]
+    # 数据参数声明为c_char_p: bytes经缓冲区协议直接传入, 调用点
+    # 无需ctypes.cast(长度单独传递, 负载含NUL字节也无影响)
+    _lib.RB_Write.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_size_t]
     _lib.RB_Write.restype = ctypes.c_int
 
     _lib.RB_Read.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t, ctypes.POINTER(ctypes.c_size_t)]
@@ -163,7 +236,7 @@ class NativeMethods:
     _lib.SMM_Destroy.argtypes = [ctypes.c_void_p]
     _lib.SMM_Destroy.restype = None
 
-    _lib.SMM_SendMessage.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t]
+    _lib.SMM_SendMessage.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_size_t]
     _lib.SMM_SendMessage.restype = ctypes.c_int
 
     _lib.SMM_ReceiveMessage.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t, ctypes.POINTER(ctypes.c_size_t), ctypes.c_int]
@@ -192,8 +265,13 @@ class RingBuffer:
     def __init__(self, name: str, buffer_size: int = 1024 * 1024):
         self.name = name.encode('utf-8')
         self.buffer_size = buffer_size
-        self._handle = None
+        # _handle在connect时包装成c_void_p, ctypes调用不必每次重新
+        # 包装Python整数
+        self._handle: Optional[ctypes.c_void_p] = None
         self._disposed = False
+        # 连接状态只在connect/dispose时变化, 缓存后热路径不必每次
+        # 调用都付一次RB_IsConnected FFI; 用户侧查询走is_connected属性
+        self._connected_flag = False
 
     def __del__(self):
         self.dispose()
@@ -201,6 +279,7 @@ class RingBuffer:
     def dispose(self):
         """释放资源"""
         if not self._disposed and self._handle:
+            self._connected_flag = False
             NativeMethods._lib.RB_Close(self._handle)
             self._handle = None
             self._disposed = True
@@ -215,14 +294,15 @@ class RingBuffer:
     @property
     def free_space(self) -> int:
         """可用空间"""
-        if not self.is_connected:
+        # 只做本地句柄检查, 不为一次查询额外付一次RB_IsConnected FFI
+        if self._disposed or not self._handle:
             return 0
         return NativeMethods._lib.RB_GetFreeSpace(self._handle)
 
     @property
     def used_space(self) -> int:
         """已用空间"""
-        if not self.is_connected:
+        if self._disposed or not self._handle:
             return 0
         return NativeMethods._lib.RB_GetUsedSpace(self._handle)
 
@@ -249,21 +329,35 @@ class RingBuffer:
 class SharedMemoryProducer(RingBuffer):
     def __init__(self, name: str, buffer_size: int = 1024 * 1024):
         super().__init__(name, buffer_size)
+        # send_message的序列化缓冲区, 按需增长并跨调用复用
+        self._send_buf: Optional[bytearray] = None
 
     def connect(self) -> bool:
         """连接到共享内存"""
-        if self.is_connected:
+        if self._connected_flag:
             return True
 
-        self._handle = NativeMethods._lib.RB_CreateProducer(self.name, self.buffer_size)
-        return self.is_connected
+        handle = NativeMethods._lib.RB_CreateProducer(self.name, self.buffer_size)
+        self._handle = ctypes.c_void_p(handle) if handle else None
+        self._connected_flag = self.is_connected
+        return self._connected_flag
 
-    def send(self, data: bytes) -> bool:
-        """发送数据"""
-        if not self.is_connected or not data:
+    def send(self, data: Union[bytes, bytearray, memoryview]) -> bool:
+        """发送数据, 接受任意bytes-like对象"""
+        if not self._connected_flag or not data:
             return False
 
-        data_ptr = ctypes.cast(data, ctypes.c_void_p)
+        if _native is not None:
+            return _native.rb_write(self._handle.value, data) != 0
+
+        if isinstance(data, bytes):
+            # bytes直接作c_char_p实参传入, 不经过ctypes.cast的类型
+            # 系统分派
+            data_ptr = data
+        else:
+            # 可变缓冲区(bytearray/memoryview)直接通过缓冲区协议传入,
+            # 不产生中间bytes拷贝
+            data_ptr = (ctypes.c_char * len(data)).from_buffer(data)
         result = NativeMethods._lib.RB_Write(self._handle, data_ptr, len(data))
         return result != 0
 
@@ -275,21 +369,68 @@ class SharedMemoryProducer(RingBuffer):
 
     def send_message(self, message: SharedMemoryMessage) -> bool:
         """发送消息"""
-        if not self.is_connected or not message:
+        if not self._connected_flag or not message:
             return False
-        data = message.serialize()
-        return self.send(data)
+
+        # 序列化进复用缓冲区, 整条消息一次分配都不产生
+        total = message.total_size
+        buf = self._send_buf
+        if buf is None or len(buf) < total:
+            buf = self._send_buf = bytearray(max(total, 4096))
+        message.serialize_into(buf, 0)
+        return self.send(memoryview(buf)[:total])
 
     def send_message_data(self, message_type: MessageType, data: bytes) -> bool:
         """发送消息数据"""
         message = SharedMemoryMessage(message_type, data)
         return self.send_message(message)
 
+    def send_values(self, message_type: MessageType, *values, flags: int = 0) -> bool:
+        """按register_schema注册的固定结构发送消息.
+
+        头和负载字段用一个预编译Struct一次pack_into写入复用缓冲区,
+        省去构造SharedMemoryMessage对象与头、负载分两段序列化的开销;
+        未注册的类型返回False."""
+        entry = SharedMemoryMessage._schemas.get(int(message_type))
+        if entry is None or not self._connected_flag:
+            return False
+
+        full, payload_size = entry
+        total = full.size
+        buf = self._send_buf
+        if buf is None or len(buf) < total:
+            buf = self._send_buf = bytearray(max(total, 4096))
+        full.pack_into(buf, 0,
+                       next(SharedMemoryMessage._id_counter),
+                       int(message_type),
+                       payload_size,
+                       time.time_ns() // 1_000_000,
+                       flags,
+                       *values)
+        return self.send(memoryview(buf)[:total])
+
     def send_batch(self, data_list: List[bytes]) -> int:
-        """批量发送数据"""
-        if not self.is_connected or not data_list:
+        """批量发送数据.
+
+        环形缓冲区是无分帧的字节流, 拼接后一次RB_Write与逐条写入
+        在wire上等价, 因此整批只过一次FFI; 空间不足时退回逐条发送,
+        尽量发出能容纳的部分."""
+        if not self._connected_flag or not data_list:
             return 0
 
+        total = sum(len(data) for data in data_list)
+        buf = self._send_buf
+        if buf is None or len(buf) < total:
+            buf = self._send_buf = bytearray(max(total, 4096))
+        pos = 0
+        for data in data_list:
+            end = pos + len(data)
+            buf[pos:end] = data
+            pos = end
+
+        if self.send(memoryview(buf)[:total]):
+            return len(data_list)
+
         sent_count = 0
         for data in data_list:
             if self.send(data):
@@ -302,39 +443,61 @@ class SharedMemoryProducer(RingBuffer):
 class SharedMemoryConsumer(RingBuffer):
     def __init__(self, name: str, buffer_size: int = 1024 * 1024):
         super().__init__(name, buffer_size)
+        # 接收缓冲区只分配一次, 每次receive复用, 避免每次调用分配
+        # buffer_size大小的临时缓冲区
+        self._recv_buf = (ctypes.c_ubyte * buffer_size)()
+        self._recv_view = memoryview(self._recv_buf)
+        # 一次RB_Read可能带回发送端连续写入(如send_batch)的多条消息;
+        # 逐条接收路径解析第一条后, 余下字节保留在这里供下次调用,
+        # 不再被丢弃
+        self._pending: Optional[bytes] = None
+        self._pending_pos = 0
 
     def connect(self) -> bool:
         """连接到共享内存"""
         if self.is_connected:
             return True
 
-        self._handle = NativeMethods._lib.RB_CreateConsumer(self.name, self.buffer_size)
-        return self.is_connected
+        handle = NativeMethods._lib.RB_CreateConsumer(self.name, self.buffer_size)
+        self._handle = ctypes.c_void_p(handle) if handle else None
+        self._connected_flag = self.is_connected
+        return self._connected_flag
 
-    def receive(self, timeout_ms: int = -1) -> Optional[bytes]:
-        """接收数据"""
-        if not self.is_connected:
-            return None
+    def receive_view(self, timeout_ms: int = -1) -> Optional[memoryview]:
+        """接收数据, 返回指向内部缓冲区的只读视图(零拷贝).
 
-        if self.is_empty:
+        视图借用消费者的接收缓冲区, 在下一次receive/receive_view调用时
+        失效; 需要长期持有数据的调用方应自行tobytes()."""
+        if not self._connected_flag:
             return None
 
-        # 创建缓冲区
-        buffer_size = self.buffer_size_total
-        buffer = ctypes.create_string_buffer(buffer_size)
-        bytes_read = ctypes.c_size_t()
+        # 不做is_empty预检: 空缓冲区时RB_Read自己返回0字节, 预检只是
+        # 平添两次FFI往返
+        if _native is not None:
+            count = _native.rb_read(self._handle.value, self._recv_view)
+            if count <= 0:
+                return None
+            return self._recv_view[:count].toreadonly()
 
+        bytes_read = ctypes.c_size_t()
         result = NativeMethods._lib.RB_Read(
             self._handle,
-            buffer,
-            buffer_size,
+            self._recv_buf,
+            self.buffer_size,
             ctypes.byref(bytes_read)
         )
 
         if result == 0 or bytes_read.value == 0:
             return None
 
-        return buffer.raw[:bytes_read.value]
+        return self._recv_view[:bytes_read.value].toreadonly()
+
+    def receive(self, timeout_ms: int = -1) -> Optional[bytes]:
+        """接收数据"""
+        view = self.receive_view(timeout_ms)
+        if view is None:
+            return None
+        return view.tobytes()
 
     def receive_string(self, timeout_ms: int = -1) -> Optional[str]:
         """接收字符串"""
@@ -343,16 +506,123 @@ class SharedMemoryConsumer(RingBuffer):
             return data.decode('utf-8')
         return None
 
+    def _receive_framed(self, timeout_ms: int = -1) -> Optional[memoryview]:
+        """取下一条完整消息的视图, 多余字节保留到下次调用.
+
+        环形缓冲区是无分帧的字节流, 一次读取可能横跨多条消息; 这里
+        按头部payload_size切出第一条, 余量拷贝到_pending(接收视图在
+        下一次RB_Read时失效, 必须拷贝), 后续调用先消费_pending再读
+        共享内存. 头部残缺或长度非法时原样返回, 由调用方按解析失败
+        处理."""
+        pending = self._pending
+        if pending is not None:
+            view = memoryview(pending)[self._pending_pos:]
+        else:
+            view = self.receive_view(timeout_ms)
+            if view is None:
+                return None
+
+        if len(view) >= HEADER_SIZE:
+            payload_size = _HDR.unpack_from(view, 0)[2]
+            end = HEADER_SIZE + payload_size
+            if 0 <= payload_size <= len(view) - HEADER_SIZE and end < len(view):
+                if pending is None:
+                    self._pending = bytes(view[end:])
+                    self._pending_pos = 0
+                else:
+                    self._pending_pos += end
+                return view[:end]
+
+        # 恰好消费完或无法定界: 交出整个视图并清空余量
+        self._pending = None
+        return view
+
     def receive_message(self, timeout_ms: int = -1) -> Optional[SharedMemoryMessage]:
         """接收消息"""
-        data = self.receive(timeout_ms)
-        if data:
+        # 直接从接收缓冲区视图解析, 负载只拷贝一次; 不先tobytes()
+        # 整条消息再让deserialize二次切片
+        view = self._receive_framed(timeout_ms)
+        if view is not None:
             try:
-                return SharedMemoryMessage.deserialize(data)
+                return SharedMemoryMessage._fast_deserialize(view)
             except ValueError:
                 return None
         return None
 
+    def receive_message_into(self, out_message: SharedMemoryMessage,
+                             timeout_ms: int = -1) -> bool:
+        """接收消息并填充到out_message, 成功返回True.
+
+        头字段从接收缓冲区unpack后直接赋给out_message, 不构造新的
+        消息对象, 整条消息只有负载一次拷贝; 适合高频接收循环复用
+        同一个消息实例."""
+        view = self._receive_framed(timeout_ms)
+        if view is None or len(view) < HEADER_SIZE:
+            return False
+
+        (out_message.message_id, out_message.message_type, payload_size,
+         out_message.timestamp, out_message.flags) = _HDR.unpack_from(view, 0)
+        if payload_size > len(view) - HEADER_SIZE:
+            return False
+        out_message.payload = bytes(view[HEADER_SIZE:HEADER_SIZE + payload_size])
+        return True
+
+    def receive_message_view(self, timeout_ms: int = -1) -> Optional[Tuple[tuple, memoryview]]:
+        """接收消息, 返回(头字段元组, 负载只读视图) —— 零拷贝.
+
+        负载视图借用接收缓冲区, 在下一次receive*调用时失效; 能就地
+        处理负载的调用方可完全避免拷贝."""
+        view = self._receive_framed(timeout_ms)
+        if view is None or len(view) < HEADER_SIZE:
+            return None
+
+        header = _HDR.unpack_from(view, 0)
+        payload_size = header[2]
+        if payload_size > len(view) - HEADER_SIZE:
+            return None
+        return header, view[HEADER_SIZE:HEADER_SIZE + payload_size]
+
+    def receive_values(self, timeout_ms: int = -1) -> Optional[Tuple[int, Any]]:
+        """接收固定结构消息, 返回(消息类型, 字段值元组).
+
+        按头部消息类型分派到register_schema注册的Struct, 头+负载
+        一次unpack_from直接从接收缓冲区取值; 未注册的类型退回通用
+        解析, 第二个元素为SharedMemoryMessage."""
+        view = self._receive_framed(timeout_ms)
+        if view is None or len(view) < HEADER_SIZE:
+            return None
+
+        message_type = _HDR.unpack_from(view, 0)[1]
+        entry = SharedMemoryMessage._schemas.get(message_type)
+        if entry is not None and len(view) >= entry[0].size:
+            # 前5项是头字段, 其余即负载字段值
+            return message_type, entry[0].unpack_from(view, 0)[5:]
+
+        try:
+            return message_type, SharedMemoryMessage.deserialize(view)
+        except ValueError:
+            return None
+
+    def receive_messages(self, max_count: int, timeout_ms: int = -1) -> List[SharedMemoryMessage]:
+        """批量接收消息: 一次读取后按消息头逐条解析.
+
+        发送端连续写入的消息在一次RB_Read中成批到达; 经由
+        _receive_framed逐条定界, 整批仍只付一次FFI开销, 且超出
+        max_count的消息保留在余量缓冲区供下次接收, 不再被丢弃."""
+        if max_count <= 0:
+            return []
+
+        messages = []
+        while len(messages) < max_count:
+            view = self._receive_framed(timeout_ms if not messages else 0)
+            if view is None:
+                break
+            try:
+                messages.append(SharedMemoryMessage._fast_deserialize(view))
+            except ValueError:
+                break
+        return messages
+
     def peek(self) -> Optional[bytes]:
         """查看数据但不移动指针"""
         # 简化的实现，实际可能需要更复杂的逻辑
@@ -360,17 +630,19 @@ class SharedMemoryConsumer(RingBuffer):
 
     def receive_batch(self, max_count: int, timeout_ms: int = -1) -> List[bytes]:
         """批量接收数据"""
-        if not self.is_connected or max_count <= 0:
+        if not self._connected_flag or max_count <= 0:
             return []
 
         result = []
-        start_time = time.time()
+        # monotonic_ns直接返回整数且不受系统时钟回拨影响, 比
+        # time.time()的浮点乘法+取整更适合超时计算
+        start_ns = time.monotonic_ns()
 
         for i in range(max_count):
             # 计算剩余超时时间
             remaining_timeout = timeout_ms
             if timeout_ms > 0:
-                elapsed = int((time.time() - start_time) * 1000)
+                elapsed = (time.monotonic_ns() - start_ns) // 1_000_000
                 remaining_timeout = timeout_ms - elapsed
                 if remaining_timeout <= 0:
                     break
@@ -391,6 +663,9 @@ class SharedMemoryManager:
         self._handle = None
         self._disposed = False
         self._is_producer = False
+        # 接收缓冲区在消费者首次接收时分配一次, 之后复用
+        self._recv_buf = None
+        self._recv_view: Optional[memoryview] = None
 
     def __del__(self):
         self.dispose()
@@ -447,11 +722,14 @@ class SharedMemoryManager:
             return False
 
         data = message.serialize()
-        data_ptr = ctypes.cast(data, ctypes.c_void_p)
+
+        if _native is not None:
+            return _native.smm_send_message(self._handle, message.message_type, data) != 0
+
         result = NativeMethods._lib.SMM_SendMessage(
             self._handle,
             message.message_type,
-            data_ptr,
+            data,
             len(data)
         )
         return result != 0
@@ -466,25 +744,33 @@ class SharedMemoryManager:
         if not self.is_running:
             return None
 
-        # 创建缓冲区
-        buffer_size = self.buffer_size
-        buffer = ctypes.create_string_buffer(buffer_size)
-        bytes_read = ctypes.c_size_t()
+        buffer = self._recv_buf
+        if buffer is None:
+            buffer = self._recv_buf = (ctypes.c_ubyte * self.buffer_size)()
+            self._recv_view = memoryview(buffer)
 
-        result = NativeMethods._lib.SMM_ReceiveMessage(
-            self._handle,
-            buffer,
-            buffer_size,
-            ctypes.byref(bytes_read),
-            timeout_ms
-        )
-
-        if result == 0 or bytes_read.value == 0:
-            return None
+        if _native is not None:
+            count = _native.smm_receive_message(
+                self._handle, self._recv_view, timeout_ms)
+            if count <= 0:
+                return None
+        else:
+            bytes_read = ctypes.c_size_t()
+            result = NativeMethods._lib.SMM_ReceiveMessage(
+                self._handle,
+                buffer,
+                self.buffer_size,
+                ctypes.byref(bytes_read),
+                timeout_ms
+            )
+
+            if result == 0 or bytes_read.value == 0:
+                return None
+            count = bytes_read.value
 
-        message_data = buffer.raw[:bytes_read.value]
+        # 从缓冲区视图直接解析, 不先整条raw[:n]拷贝再二次切片
         try:
-            return SharedMemoryMessage.deserialize(message_data)
+            return SharedMemoryMessage._fast_deserialize(self._recv_view[:count])
         except ValueError:
             return None
 
@@ -526,6 +812,24 @@ class SharedMemoryFactory:
                 return manager
         return None
 
+# 类型化数据的1字节类型标签: 发送方标明负载编码方式, 接收方按标签
+# 直接分派, 不再用try/except逐个试探解码(异常对象构造在热路径上
+# 代价很高)
+_TAG_RAW = b'\x00'
+_TAG_TEXT = b'\x01'
+_TAG_PICKLE = b'\x02'
+
+def _decode_typed(data: bytes) -> Any:
+    """按类型标签解码负载; 无法识别的标签按原始字节返回"""
+    tag = data[:1]
+    if tag == _TAG_TEXT:
+        return data[1:].decode('utf-8')
+    if tag == _TAG_PICKLE:
+        return pickle.loads(data[1:])
+    if tag == _TAG_RAW:
+        return data[1:]
+    return data
+
 # 泛型封装
 class TypedSharedMemoryProducer:
     def __init__(self, name: str, buffer_size: int = 1024 * 1024):
@@ -536,17 +840,15 @@ class TypedSharedMemoryProducer:
         return self._producer.connect()
 
     def send_typed(self, data: Any) -> bool:
-        """发送类型化数据"""
+        """发送类型化数据(带1字节类型标签)"""
         try:
-            # 尝试将数据转换为字节
             if isinstance(data, (int, float, str)):
-                data_bytes = str(data).encode('utf-8')
-            elif isinstance(data, bytes):
-                data_bytes = data
+                data_bytes = _TAG_TEXT + str(data).encode('utf-8')
+            elif isinstance(data, (bytes, bytearray, memoryview)):
+                data_bytes = _TAG_RAW + bytes(data)
             else:
                 # 对于复杂对象，使用pickle序列化
-                import pickle
-                data_bytes = pickle.dumps(data)
+                data_bytes = _TAG_PICKLE + pickle.dumps(data)
 
             return self._producer.send(data_bytes)
         except Exception as e:
@@ -572,35 +874,16 @@ class TypedSharedMemoryConsumer:
         return self._consumer.connect()
 
     def receive_typed(self, timeout_ms: int = -1) -> Optional[Any]:
-        """接收类型化数据"""
+        """接收类型化数据, 按类型标签分派解码"""
         data = self._consumer.receive(timeout_ms)
         if data:
-            try:
-                # 尝试解析为基本类型
-                return data.decode('utf-8')
-            except:
-                # 如果不是字符串，尝试pickle反序列化
-                try:
-                    import pickle
-                    return pickle.loads(data)
-                except:
-                    return data
+            return _decode_typed(data)
         return None
 
     def receive_list(self, max_count: int, timeout_ms: int = -1) -> List[Any]:
         """接收列表数据"""
         raw_list = self._consumer.receive_batch(max_count, timeout_ms)
-        result = []
-        for data in raw_list:
-            try:
-                result.append(data.decode('utf-8'))
-            except:
-                try:
-                    import pickle
-                    result.append(pickle.loads(data))
-                except:
-                    result.append(data)
-        return result
+        return [_decode_typed(data) for data in raw_list]
 
 # 便利函数
 def create_producer(name: str, buffer_size: int = 1024 * 1024) -> Optional[SharedMemoryProducer]:
@@ -0,0 +1,98 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Cython绑定的共享内存原生接口
+
+可选的NativeMethods加速层: 直接以C原型声明原生函数, 避免ctypes每次
+调用的参数封送开销. 使用`cythonize -i shared_memory_native.pyx`构建,
+并设置BITRPC_CYTHON=1启用; 不可用时shared_memory_api.py自动回退到
+ctypes路径."""
+
+from libc.stddef cimport size_t
+
+cdef extern from "shared_memory_api.h":
+    ctypedef void* RingBufferHandle
+    ctypedef void* SharedMemoryManagerHandle
+
+    RingBufferHandle RB_CreateProducer(const char* name, size_t buffer_size) nogil
+    RingBufferHandle RB_CreateConsumer(const char* name, size_t buffer_size) nogil
+    void RB_Close(RingBufferHandle handle) nogil
+    int RB_Write(RingBufferHandle handle, const void* data, size_t size) nogil
+    int RB_Read(RingBufferHandle handle, void* buffer, size_t buffer_size, size_t* bytes_read) nogil
+    int RB_GetFreeSpace(RingBufferHandle handle) nogil
+    int RB_GetUsedSpace(RingBufferHandle handle) nogil
+    int RB_IsConnected(RingBufferHandle handle) nogil
+
+    SharedMemoryManagerHandle SMM_CreateProducer(const char* name, size_t buffer_size) nogil
+    SharedMemoryManagerHandle SMM_CreateConsumer(const char* name, size_t buffer_size) nogil
+    void SMM_Destroy(SharedMemoryManagerHandle handle) nogil
+    int SMM_SendMessage(SharedMemoryManagerHandle handle, int message_type, const void* data, size_t size) nogil
+    int SMM_ReceiveMessage(SharedMemoryManagerHandle handle, void* buffer, size_t buffer_size, size_t* bytes_read, int timeout_ms) nogil
+    int SMM_IsRunning(SharedMemoryManagerHandle handle) nogil
+
+    const char* RB_GetLastError() nogil
+
+
+# 句柄以size_t整数在Python侧传递, 与ctypes返回的c_void_p整数互通
+
+def rb_create_producer(bytes name, size_t buffer_size):
+    return <size_t>RB_CreateProducer(name, buffer_size)
+
+def rb_create_consumer(bytes name, size_t buffer_size):
+    return <size_t>RB_CreateConsumer(name, buffer_size)
+
+def rb_close(size_t handle):
+    RB_Close(<RingBufferHandle>handle)
+
+def rb_write(size_t handle, const unsigned char[::1] data):
+    cdef size_t size = data.shape[0]
+    if size == 0:
+        return 0
+    return RB_Write(<RingBufferHandle>handle, &data[0], size)
+
+def rb_read(size_t handle, unsigned char[::1] out):
+    """读取数据到out缓冲区, 返回读取的字节数(失败返回-1)"""
+    cdef size_t bytes_read = 0
+    cdef int result = RB_Read(<RingBufferHandle>handle, &out[0], out.shape[0], &bytes_read)
+    if result == 0:
+        return -1
+    return bytes_read
+
+def rb_get_free_space(size_t handle):
+    return RB_GetFreeSpace(<RingBufferHandle>handle)
+
+def rb_get_used_space(size_t handle):
+    return RB_GetUsedSpace(<RingBufferHandle>handle)
+
+def rb_is_connected(size_t handle):
+    return RB_IsConnected(<RingBufferHandle>handle)
+
+def smm_create_producer(bytes name, size_t buffer_size):
+    return <size_t>SMM_CreateProducer(name, buffer_size)
+
+def smm_create_consumer(bytes name, size_t buffer_size):
+    return <size_t>SMM_CreateConsumer(name, buffer_size)
+
+def smm_destroy(size_t handle):
+    SMM_Destroy(<SharedMemoryManagerHandle>handle)
+
+def smm_send_message(size_t handle, int message_type, const unsigned char[::1] data):
+    cdef size_t size = data.shape[0]
+    return SMM_SendMessage(<SharedMemoryManagerHandle>handle, message_type,
+                           &data[0] if size else NULL, size)
+
+def smm_receive_message(size_t handle, unsigned char[::1] out, int timeout_ms):
+    """接收消息到out缓冲区, 返回读取的字节数(失败返回-1)"""
+    cdef size_t bytes_read = 0
+    cdef int result = SMM_ReceiveMessage(<SharedMemoryManagerHandle>handle, &out[0],
+                                         out.shape[0], &bytes_read, timeout_ms)
+    if result == 0:
+        return -1
+    return bytes_read
+
+def smm_is_running(size_t handle):
+    return SMM_IsRunning(<SharedMemoryManagerHandle>handle)
+
+def get_last_error():
+    cdef const char* error = RB_GetLastError()
+    if error == NULL:
+        return ""
+    return error.decode('utf-8')